@@ -0,0 +1,189 @@
+"""
+Small static file server for the content-hashed files under static/.
+
+Streamlit's own app/static route answers without long-lived cache headers,
+so browsers keep revalidating. This server serves the same directory under
+the same /app/static/ prefix, marking hashed names as immutable. Put it
+behind a proxy route for /app/static/ or point PORTFOLIO_ASSET_BASE_URL at it.
+Like Streamlit's route it answers If-None-Match with 304 and single byte
+ranges with 206, so resumed or repeated downloads (the resume PDF) don't
+resend the whole file. Text files with precompressed siblings (see
+precompress.py) are sent brotli- or gzip-encoded per Accept-Encoding,
+with Vary: Accept-Encoding so caches keep the variants apart.
+
+--root and --prefix serve another directory, e.g. the static export:
+
+    python asset_server.py --root site --prefix /
+
+    python asset_server.py --port 8502
+"""
+import argparse
+import http.server
+import os
+import re
+import threading
+
+import assets
+import precompress
+
+URL_PREFIX = "/app/static/"
+HASHED_NAME = re.compile(r"\.([0-9a-f]{16})\.\w+$")
+BYTE_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Only these may be cached; an error for a hashed name must not stick for a year
+CACHEABLE_STATUS = (200, 206, 304)
+
+
+class AssetRequestHandler(http.server.SimpleHTTPRequestHandler):
+    root = assets.STATIC_DIR
+    url_prefix = URL_PREFIX
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=self.root, **kwargs)
+
+    def translate_path(self, path):
+        if path.startswith(self.url_prefix):
+            path = "/" + path[len(self.url_prefix):]
+        return super().translate_path(path)
+
+    def send_response(self, code, message=None):
+        self.status = code
+        super().send_response(code, message)
+
+    def send_head(self):
+        self.send_length = None
+        if not self.path.split("?", 1)[0].startswith(self.url_prefix):
+            # Nothing outside the prefix, or the working directory would be exposed
+            self.send_error(404, "File not found")
+            return None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and self.path.endswith("/"):
+            path = os.path.join(path, "index.html")
+        if not os.path.isfile(path):
+            self.send_error(404, "File not found")
+            return None
+        encoding, served = precompress.negotiate(path, self.headers.get("Accept-Encoding"))
+        try:
+            file = open(served, "rb")
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        try:
+            size = os.fstat(file.fileno()).st_size
+            etag = f'"{self.etag(path)}{"-" + encoding if encoding else ""}"'
+            vary = precompress.is_text(path)
+            if etag in self.headers.get("If-None-Match", ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                if vary:
+                    self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                file.close()
+                return None
+
+            start, end = 0, size - 1
+            requested = self.headers.get("Range")
+            if_range = self.headers.get("If-Range")
+            if requested and (if_range is None or if_range == etag):
+                match = BYTE_RANGE.match(requested.strip())
+                if match and match.group(1):
+                    start = int(match.group(1))
+                    end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+                elif match and match.group(2):  # suffix: the last N bytes
+                    start = max(0, size - int(match.group(2)))
+                else:
+                    match = None  # multiple or malformed ranges: send it all
+                if match and start >= size:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.end_headers()
+                    file.close()
+                    return None
+                if match and start <= end:
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                else:
+                    start, end = 0, size - 1
+                    self.send_response(200)
+            else:
+                self.send_response(200)
+            file.seek(start)
+            self.send_length = end - start + 1
+            self.send_header("Content-Type", self.guess_type(path))
+            self.send_header("Content-Length", str(self.send_length))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if vary:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("ETag", etag)
+            self.send_header("Accept-Ranges", "bytes")
+            self.end_headers()
+            return file
+        except Exception:
+            file.close()
+            raise
+
+    def etag(self, path):
+        """The content hash for hashed names, else mtime and size."""
+        match = HASHED_NAME.search(path)
+        if match:
+            return match.group(1)
+        stat = os.stat(path)
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    def copyfile(self, source, outputfile):
+        if self.send_length is None:
+            return super().copyfile(source, outputfile)
+        remaining = self.send_length
+        while remaining > 0:
+            chunk = source.read(min(remaining, 64 * 1024))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+
+    def list_directory(self, path):
+        self.send_error(404, "File not found")
+        return None
+
+    def end_headers(self):
+        url_path = self.path.split("?", 1)[0]
+        if getattr(self, "status", None) not in CACHEABLE_STATUS:
+            self.send_header("Cache-Control", "no-store")
+        elif HASHED_NAME.search(url_path):
+            self.send_header("Cache-Control", IMMUTABLE)
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("X-Content-Type-Options", "nosniff")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_lock = threading.Lock()
+
+
+def start(port, host="0.0.0.0"):
+    """Start the server on a daemon thread once per process."""
+    global _server
+    with _lock:
+        if _server is None:
+            _server = http.server.ThreadingHTTPServer((host, port), AssetRequestHandler)
+            threading.Thread(target=_server.serve_forever, name="asset-server", daemon=True).start()
+    return _server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve hashed portfolio assets")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--root", default=assets.STATIC_DIR, help="directory to serve")
+    parser.add_argument("--prefix", default=URL_PREFIX, help="URL path it is served under")
+    args = parser.parse_args()
+    handler = type("Handler", (AssetRequestHandler,),
+                   {"root": os.path.abspath(args.root), "url_prefix": args.prefix})
+    print(f"Serving {handler.root} at http://{args.host}:{args.port}{args.prefix}")
+    http.server.ThreadingHTTPServer((args.host, args.port), handler).serve_forever()
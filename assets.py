@@ -0,0 +1,333 @@
+"""
+Process-wide asset helpers for Portfolio.py.
+
+Streamlit re-executes Portfolio.py on every rerun, but imported modules stay
+loaded for the life of the server process. State kept here is therefore
+shared by every session instead of being rebuilt per rerun per user.
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import precompress
+
+# Byte budget for encoded assets, overridable with PORTFOLIO_ASSET_CACHE_MB
+DEFAULT_CACHE_MB = 64
+
+# Streamlit serves <app dir>/static at app/static/ when
+# server.enableStaticServing is on (see .streamlit/config.toml)
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, "static")
+STATIC_ASSET_DIR = os.path.join(STATIC_DIR, "assets")
+MANIFEST_PATH = os.path.join(STATIC_ASSET_DIR, "manifest.json")
+ASSET_BASE_URL = os.environ.get("PORTFOLIO_ASSET_BASE_URL", "app/static/assets/")
+
+MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+    "gif": "image/gif",
+    "svg": "image/svg+xml",
+}
+
+
+def guess_mime(path):
+    ext = path.rsplit(".", 1)[-1].lower()
+    return MIME_TYPES.get(ext, "image/jpeg")
+
+
+class AssetCache:
+    """
+    Thread-safe LRU cache bounded by total value size in bytes.
+
+    Concurrent misses on the same key are collapsed: one caller computes the
+    value while the others wait for it, so each asset is encoded once per
+    process rather than once per session.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._latest = {}    # (kind, path) -> newest key, for mtime invalidation
+        self._pending = {}   # key -> Event while a value is being computed
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+                event = self._pending.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._pending[key] = event
+                    self.misses += 1
+                    break
+            # Someone else is computing this key; wait and re-check
+            event.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    def _store(self, key, value):
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        # A new mtime/size for the same file makes the old entry unreachable
+        stale = self._latest.get(key[:2])
+        if stale is not None and stale != key and stale in self._entries:
+            self._drop(stale)
+        self._latest[key[:2]] = key
+        self._entries[key] = value
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key):
+        value = self._entries.pop(key)
+        self.current_bytes -= len(value)
+        if self._latest.get(key[:2]) == key:
+            del self._latest[key[:2]]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _budget_from_env():
+    try:
+        mb = float(os.environ.get("PORTFOLIO_ASSET_CACHE_MB", DEFAULT_CACHE_MB))
+    except ValueError:
+        mb = DEFAULT_CACHE_MB
+    return int(mb * 1024 * 1024)
+
+
+asset_cache = AssetCache(_budget_from_env())
+
+
+def app_path(path):
+    """
+    Absolute path of a content file, or None if it doesn't exist. Relative
+    paths resolve against the app directory, not the working directory; an
+    absolute path from another machine (say a Windows 'D:/...' path) falls
+    back to the file of the same name next to the app.
+    """
+    candidates = [path] if os.path.isabs(path) else []
+    candidates.append(os.path.join(APP_DIR, path))
+    candidates.append(os.path.join(APP_DIR, os.path.basename(path.replace("\\", "/"))))
+    return next((c for c in candidates if os.path.isfile(c)), None)
+
+
+def file_key(kind, path):
+    """Cache key that changes whenever the file is modified or replaced."""
+    st = os.stat(path)
+    return (kind, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def encode_data_uri(path):
+    with open(path, "rb") as file:
+        encoded = base64.b64encode(file.read()).decode()
+    return f"data:{guess_mime(path)};base64,{encoded}"
+
+
+def cached_data_uri(path):
+    """Base64 data URI for a local file, computed once per file version."""
+    return asset_cache.get_or_compute(file_key("data-uri", path), lambda: encode_data_uri(path))
+
+
+def file_bytes(path):
+    """A local file's contents, read once per file version."""
+    def read():
+        with open(path, "rb") as file:
+            return file.read()
+
+    return asset_cache.get_or_compute(file_key("bytes", path), read)
+
+
+def image_size(path):
+    """(width, height) from the file header, or None if Pillow can't read it."""
+    def read():
+        try:
+            from PIL import Image
+            with Image.open(path) as image:
+                return "%dx%d" % image.size
+        except Exception:
+            return ""
+
+    dims = asset_cache.get_or_compute(file_key("size", path), read)
+    return tuple(int(n) for n in dims.split("x")) if dims else None
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def file_hash(path):
+    with open(path, "rb") as file:
+        return content_hash(file.read())
+
+
+def hashed_name(path, digest):
+    """'Assets/Loan Approval/Loan Approval 1.png' -> 'Loan-Approval-1.<digest>.png'"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    stem = re.sub(r"[^A-Za-z0-9_-]+", "-", stem).strip("-") or "asset"
+    return f"{stem}.{digest}{ext.lower()}"
+
+
+def write_static(name, data):
+    """Write bytes under static/assets once; hashed names never change content."""
+    target = os.path.join(STATIC_ASSET_DIR, name)
+    if not os.path.exists(target):
+        os.makedirs(STATIC_ASSET_DIR, exist_ok=True)
+        tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as file:
+            file.write(data)
+        os.replace(tmp, target)
+        # Text assets (the stylesheet) also get .gz/.br siblings for asset_server.py
+        precompress.precompress_file(target)
+    return name
+
+
+def publish_static(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    return write_static(hashed_name(path, content_hash(data)), data)
+
+
+def static_url(path):
+    """Content-hashed URL for a local file, publishing it on first use."""
+    name = asset_cache.get_or_compute(file_key("static", path), lambda: publish_static(path))
+    return ASSET_BASE_URL + name
+
+
+_manifest = {"mtime": None, "data": {}}
+_manifest_lock = threading.Lock()
+
+
+def load_manifest():
+    """The build_assets.py manifest, re-read only when the file changes."""
+    try:
+        mtime = os.stat(MANIFEST_PATH).st_mtime_ns
+    except OSError:
+        return {}
+    with _manifest_lock:
+        if _manifest["mtime"] != mtime:
+            try:
+                with open(MANIFEST_PATH, encoding="utf-8") as file:
+                    _manifest["data"] = json.load(file)
+            except (OSError, ValueError):
+                _manifest["data"] = {}
+            _manifest["mtime"] = mtime
+        return _manifest["data"]
+
+
+def manifest_entry(path):
+    """Built variants for a local file, or None if it was not built (or changed since)."""
+    entries = load_manifest().get("assets")
+    if not entries:
+        return None
+    digest = asset_cache.get_or_compute(file_key("hash", path), lambda: file_hash(path))
+    return entries.get(digest)
+
+
+def largest_variant(entry, fmt="webp"):
+    return max((v for v in entry["variants"] if v["format"] == fmt), key=lambda v: v["width"])
+
+
+def srcset(entry, fmt, base_url=None):
+    """'<url> 480w, <url> 768w, ...' for one format of a manifest entry."""
+    base_url = ASSET_BASE_URL if base_url is None else base_url
+    variants = sorted((v for v in entry["variants"] if v["format"] == fmt), key=lambda v: v["width"])
+    return ", ".join(f"{base_url}{v['file']} {v['width']}w" for v in variants)
+
+
+def picture_html(entry, sizes, attrs="", style="", base_url=None):
+    """
+    <picture> with WebP and JPEG srcsets for a manifest entry, so each client
+    downloads only the width its layout needs. The blurred placeholder is
+    set as a background that the real image paints over once it arrives.
+    """
+    base_url = ASSET_BASE_URL if base_url is None else base_url
+    if entry.get("placeholder"):
+        style = f"background:url({entry['placeholder']}) center / cover no-repeat; {style}"
+    fallback = largest_variant(entry, "jpeg")
+    return (
+        f'<picture>'
+        f'<source type="image/webp" srcset="{srcset(entry, "webp", base_url)}" sizes="{sizes}">'
+        f'<img src="{base_url}{fallback["file"]}" srcset="{srcset(entry, "jpeg", base_url)}" '
+        f'sizes="{sizes}" width="{entry["width"]}" height="{entry["height"]}" style="{style}" {attrs}>'
+        f'</picture>'
+    )
+
+
+def minify_css(css):
+    """
+    Strip comments and insignificant whitespace. Deliberately conservative:
+    spaces before ':' are kept since 'a :hover' and 'a:hover' differ.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def stylesheet_url(css):
+    """Minify css and publish it as static/assets/portfolio.<hash>.css."""
+    def publish():
+        data = minify_css(css).encode()
+        return write_static(hashed_name("portfolio.css", content_hash(data)), data)
+
+    name = asset_cache.get_or_compute(("css", content_hash(css.encode())), publish)
+    return ASSET_BASE_URL + name
+
+
+def image_url(path, mode="static"):
+    """
+    URL for a local image in the given asset mode.
+    'static' prefers the optimized build_assets.py output, then a hashed copy
+    of the original; 'inline' (and any failure to publish, e.g. a read-only
+    checkout) embeds base64.
+    """
+    if mode == "static":
+        try:
+            entry = manifest_entry(path)
+            if entry:
+                return ASSET_BASE_URL + largest_variant(entry)["file"]
+            return static_url(path)
+        except OSError:
+            pass
+    return cached_data_uri(path)
@@ -0,0 +1,130 @@
+"""
+Precompressed text assets versus compressing on every request.
+
+Exports the site into a temporary directory (with the minified stylesheet
+and every page), then for each text file compares:
+
+    identity      the bytes sent with no compression
+    on the fly    gzip at --level (Streamlit's middleware uses 5), timed per
+                  request, which is what a server without siblings pays
+    precompressed the .gz/.br siblings precompress.py wrote, whose serving
+                  cost is reading the file
+
+and prints the bytes and CPU saved per request and over --requests
+requests, plus the one-off cost of building the siblings. Finally it
+fetches every file through asset_server.py with Accept-Encoding: br, gzip
+to check the negotiated Content-Encoding and Vary headers.
+
+    python benchmarks/compression.py [--requests 10000] [--level 5]
+"""
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import asset_server  # noqa: E402
+import export_site  # noqa: E402
+import precompress  # noqa: E402
+
+
+def cpu_per_call(fn, min_seconds=0.2):
+    """Mean CPU seconds of fn(), repeated for at least min_seconds."""
+    calls, start = 0, time.process_time()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.process_time() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def measure(out_dir, level):
+    rows = []
+    for directory, _, names in os.walk(out_dir):
+        for name in sorted(names):
+            path = os.path.join(directory, name)
+            if not precompress.is_text(path):
+                continue
+            data = read(path)
+            encoding, served = precompress.negotiate(path, "br, gzip")
+            rows.append({
+                "file": os.path.relpath(path, out_dir),
+                "identity": len(data),
+                "fly_bytes": len(gzip.compress(data, compresslevel=level)),
+                "fly_cpu": cpu_per_call(lambda: gzip.compress(data, compresslevel=level)),
+                "pre_encoding": encoding or "identity",
+                "pre_bytes": os.path.getsize(served),
+                "pre_cpu": cpu_per_call(lambda: read(served)),
+            })
+    return rows
+
+
+def check_server(out_dir, rows):
+    handler = type("Handler", (asset_server.AssetRequestHandler,), {"root": out_dir, "url_prefix": "/"})
+    server = asset_server.http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        for row in rows:
+            url = f"http://127.0.0.1:{server.server_address[1]}/{row['file']}"
+            request = urllib.request.Request(url, headers={"Accept-Encoding": "br, gzip"})
+            with urllib.request.urlopen(request) as response:
+                body = response.read()
+                row["wire_encoding"] = response.headers.get("Content-Encoding", "identity")
+                row["wire_bytes"] = len(body)
+                row["vary"] = response.headers.get("Vary", "")
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompressed vs on-the-fly compression")
+    parser.add_argument("--requests", type=int, default=10000, help="requests to extrapolate to")
+    parser.add_argument("--level", type=int, default=5, help="on-the-fly gzip level")
+    args = parser.parse_args()
+
+    out_dir = os.path.join(tempfile.mkdtemp(), "site")
+    start = time.process_time()
+    export_site.export(out_dir, build=False)
+    export_cpu = time.process_time() - start
+    build_cpu = cpu_per_call(lambda: [precompress.precompress_tree(out_dir, force=True)], min_seconds=0)
+
+    rows = measure(out_dir, args.level)
+    check_server(out_dir, rows)
+
+    print(f"{'file':<34} {'identity':>9} {'on the fly':>11} {'precomp.':>9} {'enc':>5} "
+          f"{'fly cpu':>9} {'read cpu':>9}  served as")
+    for row in rows:
+        print(f"{row['file']:<34} {row['identity']:>9,} {row['fly_bytes']:>11,} {row['pre_bytes']:>9,} "
+              f"{row['pre_encoding']:>5} {row['fly_cpu'] * 1e6:>7.0f}us {row['pre_cpu'] * 1e6:>7.0f}us  "
+              f"{row['wire_encoding']} {row['wire_bytes']:,} B, Vary: {row['vary'] or '-'}")
+
+    fly_bytes = sum(r["fly_bytes"] for r in rows)
+    pre_bytes = sum(r["pre_bytes"] for r in rows)
+    fly_cpu = sum(r["fly_cpu"] for r in rows)
+    pre_cpu = sum(r["pre_cpu"] for r in rows)
+    n = args.requests
+    print(f"\none request for every file: {sum(r['identity'] for r in rows):,} B identity, "
+          f"{fly_bytes:,} B gzip-{args.level} on the fly, {pre_bytes:,} B precompressed "
+          f"({1 - pre_bytes / fly_bytes:.1%} smaller)")
+    print(f"CPU per round: {fly_cpu * 1e3:.2f} ms on the fly vs {pre_cpu * 1e3:.2f} ms reading siblings")
+    print(f"over {n:,} rounds: {(fly_bytes - pre_bytes) * n / 1e6:,.1f} MB and "
+          f"{(fly_cpu - pre_cpu) * n:,.1f} CPU s saved; building the siblings took "
+          f"{build_cpu * 1e3:.0f} ms once (export itself {export_cpu:.1f} s)")
+    if precompress.brotli is None:
+        print("brotli is not installed: only gzip-9 siblings were built (pip install brotli)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Contact-form delivery against a local SMTP stand-in.
+
+Starts a minimal SMTP server on localhost that answers each message after
+--delay seconds and rejects the first --fail-first messages with a 451,
+then submits --messages contact forms through outbox.submit() from
+--senders threads, the way concurrent sessions would. Reports submit
+latency (which should not move with --delay), how long the worker took to
+deliver everything, and the retries it needed.
+
+    python benchmarks/contact.py [--messages 50] [--delay 0 0.5] [--fail-first 5]
+
+The queue goes to a temporary file and backoff is shortened to keep the
+run quick; nothing touches the real outbox or a real mail server.
+"""
+import argparse
+import os
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import outbox  # noqa: E402
+
+
+class StandIn:
+    """Counters shared by the stand-in's connection handlers."""
+
+    def __init__(self, delay, fail_first, quit_reply="221 Bye"):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.quit_reply = quit_reply
+        self.received = []
+        self.rejected = 0
+        self.connections = 0
+        self.lock = threading.Lock()
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        state = self.server.stand_in
+        with state.lock:
+            state.connections += 1
+        self.reply("220 localhost stand-in")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for raw in iter(self.rfile.readline, b""):
+                    if raw in (b".\r\n", b".\n"):
+                        break
+                    data.append(raw)
+                time.sleep(state.delay)
+                with state.lock:
+                    if state.rejected < state.fail_first:
+                        state.rejected += 1
+                        self.reply("451 Try again later")
+                        continue
+                    state.received.append(b"".join(data))
+                self.reply("250 Queued")
+            elif verb == "QUIT":
+                self.reply(state.quit_reply)
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+def start_stand_in(delay, fail_first, quit_reply="221 Bye"):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.stand_in = StandIn(delay, fail_first, quit_reply)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(messages, senders, delay, fail_first, timeout):
+    server = start_stand_in(delay, fail_first)
+    queue = outbox.Outbox(os.path.join(tempfile.mkdtemp(), "outbox.sqlite3"))
+    transport = outbox.SmtpTransport("127.0.0.1", server.server_address[1], user="", starttls=False)
+    outbox.outbox = queue
+    outbox._worker = outbox.DeliveryWorker(queue, transport, "owner@example.com").start()
+
+    latencies = []
+    lock = threading.Lock()
+
+    def sender(index):
+        for n in range(index, messages, senders):
+            start = time.perf_counter()
+            outbox.submit(f"Visitor {n}", f"visitor{n}@example.com", f"Message number {n} about a project.")
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=sender, args=(i,)) for i in range(senders)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    submitted = time.perf_counter() - started
+
+    state = server.stand_in
+    while len(state.received) < messages and time.perf_counter() - started < timeout:
+        time.sleep(0.05)
+    delivered = time.perf_counter() - started
+    outbox._worker.stop(timeout=5)
+    server.shutdown()
+    outbox._worker = None
+
+    latencies.sort()
+    print(f"backend delay {delay:.2f}s  submit p50 {statistics.median(latencies):6.2f} ms  "
+          f"max {latencies[-1]:6.2f} ms  all submitted in {submitted:.2f}s")
+    print(f"    delivered {len(state.received)}/{messages} in {delivered:.2f}s over "
+          f"{state.connections} connections, {state.rejected} rejected and retried, queue {queue.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact-form delivery against a local SMTP stand-in")
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--senders", type=int, default=4, help="threads submitting at once")
+    parser.add_argument("--delay", type=float, nargs="+", default=[0.0, 0.5], help="seconds per message")
+    parser.add_argument("--fail-first", type=int, default=5, help="messages the stand-in rejects first")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    outbox.BACKOFF_SECONDS = 0.2
+    for delay in args.delay:
+        run(args.messages, args.senders, delay, args.fail_first, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Count the Streamlit deltas (elements and layout blocks) and their protobuf
+bytes for each page, per top-level section of the script.
+
+    python benchmarks/deltas.py                 # current tree
+    python benchmarks/deltas.py --compare HEAD~1  # side by side with a revision
+
+Compare mode checks the revision out into a temporary git worktree and
+measures it in a subprocess.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = {"portfolio": None, "detail": "3"}
+
+
+def tree_stats(at):
+    """Elements, blocks and protobuf bytes of the page an AppTest run produced."""
+    stats = {"elements": 0, "blocks": 0, "bytes": 0}
+
+    def walk(node):
+        children = getattr(node, "children", None)
+        if children is None:
+            stats["elements"] += 1
+        else:
+            stats["blocks"] += 1
+            for child in children.values():
+                walk(child)
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            stats["bytes"] += proto.ByteSize()
+
+    for child in at._tree.children[0].children.values():
+        walk(child)
+    stats["deltas"] = stats["elements"] + stats["blocks"]
+    return stats
+
+
+def measure(root):
+    """{page: {"deltas": n, "bytes": n, "elements": n, "blocks": n}} for the app in root."""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for page, project in PAGES.items():
+        at = AppTest.from_file(os.path.join(root, "Portfolio.py"), default_timeout=120)
+        if project is not None:
+            # Older revisions routed through session state instead of the URL
+            at.query_params["project"] = project
+            at.session_state["view"] = "detail"
+            at.session_state["selected_id"] = int(project)
+        at.run()
+        results[page] = tree_stats(at)
+    return results
+
+
+def measure_revision(rev):
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = os.path.join(tmp, "tree")
+        subprocess.run(["git", "worktree", "add", "--detach", worktree, rev],
+                       cwd=ROOT, check=True, capture_output=True)
+        try:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--json"],
+                cwd=worktree, env=dict(os.environ, DELTAS_ROOT=worktree),
+                check=True, capture_output=True, text=True,
+            )
+            return json.loads(out.stdout.strip().splitlines()[-1])
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", worktree],
+                           cwd=ROOT, capture_output=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count Streamlit deltas per page")
+    parser.add_argument("--compare", metavar="REV", help="git revision to compare against")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    root = os.environ.get("DELTAS_ROOT", ROOT)
+    if args.json:
+        os.chdir(root)
+        print(json.dumps(measure(root)))
+        return
+
+    current = measure(root)
+    before = measure_revision(args.compare) if args.compare else None
+    for page, stats in current.items():
+        line = f"{page:<10} deltas {stats['deltas']:>4} (elements {stats['elements']}, blocks {stats['blocks']})  bytes {stats['bytes']:>7,}"
+        if before:
+            old = before[page]
+            line += f"   | {args.compare}: deltas {old['deltas']:>4}  bytes {old['bytes']:>7,}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
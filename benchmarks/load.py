@@ -0,0 +1,319 @@
+"""
+Concurrent-session load test for Portfolio.py.
+
+Simulates N visitors at once, each opening the portfolio and then
+repeatedly clicking "View Details", going back and changing the category
+filter. Reports p50/p95/p99 rerun latency (overall and per action), the
+payload bytes per rerun, throughput, CPU and RSS of the serving process.
+
+Two drivers:
+
+    python benchmarks/load.py [--sessions 1 4 8] [--iterations 5]
+        AppTest sessions on threads in this process, like one Streamlit
+        worker serving several browser tabs. AppTest swaps a process-wide
+        Runtime per run, so runs are serialized; latency includes the wait,
+        much as the GIL queues CPU-bound reruns in a real worker. Bytes are
+        the protobuf size of the rendered page.
+
+    python benchmarks/load.py --url ws://localhost:8501 [--server-pid PID]
+        Headless websocket clients against a running `streamlit run`.
+        Bytes are the ForwardMsgs actually received. Navigation sends the
+        ?project= query string the button's callback would set; the filter
+        sends the selectbox's widget state. Needs the websockets package.
+        Start the server with PORTFOLIO_RATE_LIMIT=0 unless the point is to
+        measure how ratelimit.py sheds the load.
+
+Each summary is appended to benchmarks/results/load.jsonl with the git
+revision and compared against the last entry for the same driver and
+session count; changes beyond --tolerance are flagged. The history is
+per machine, so benchmarks/results/ is ignored by git.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+# Simulated visitors click far faster than people; measure the app, not the limiter
+os.environ.setdefault("PORTFOLIO_RATE_LIMIT", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from deltas import tree_stats  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, "benchmarks", "results", "load.jsonl")
+SCRIPT = os.path.join(ROOT, "Portfolio.py")
+
+FILTER_LABEL = "Filter by Category:"
+COMPARED = ("p50_ms", "p95_ms", "p99_ms", "bytes_per_rerun", "cpu_pct", "rss_mb")
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))]
+
+
+def process_usage(pid=None):
+    """(cpu seconds, rss MB) for pid, or for this process."""
+    if pid is not None:
+        with open(f"/proc/{pid}/stat") as file:
+            fields = file.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        with open(f"/proc/{pid}/status") as file:
+            rss_kb = next(int(line.split()[1]) for line in file if line.startswith("VmRSS:"))
+        return cpu, rss_kb / 1024
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    try:
+        with open("/proc/self/status") as file:
+            rss_kb = next(int(line.split()[1]) for line in file if line.startswith("VmRSS:"))
+    except OSError:
+        rss_kb = usage.ru_maxrss  # peak, in KB on Linux
+    return usage.ru_utime + usage.ru_stime, rss_kb / 1024
+
+
+class Recorder:
+    """Thread-safe collector of (action, ms, bytes) samples."""
+
+    def __init__(self):
+        self.samples = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, action, ms, size):
+        with self._lock:
+            self.samples.append((action, ms, size))
+
+    def error(self):
+        with self._lock:
+            self.errors += 1
+
+
+# -- AppTest driver --
+
+# AppTest.run() installs and clears a global mock Runtime, so concurrent runs
+# would tear each other's down
+_run_lock = threading.Lock()
+
+
+def apptest_session(index, iterations, recorder, start_barrier):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(SCRIPT, default_timeout=120)
+
+    def step(action, prepare=None):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        with _run_lock:
+            at.run()
+        ms = (time.perf_counter() - start) * 1000
+        if at.exception:
+            recorder.error()
+        recorder.add(action, ms, tree_stats(at)["bytes"])
+
+    start_barrier.wait()
+    try:
+        run_scenario(at, index, iterations, step)
+    except Exception as e:
+        print(f"  session {index} failed: {e!r}")
+        recorder.error()
+
+
+def run_scenario(at, index, iterations, step):
+    step("open")
+    for i in range(iterations):
+        ids = [b.key for b in at.button if b.key and b.key.startswith("btn_")]
+        step("view_details", at.button(key=ids[(index + i) % len(ids)]).click)
+        back = next(b for b in at.button if b.label.startswith("←"))
+        step("back", back.click)
+        category = next(s for s in at.selectbox if s.label == FILTER_LABEL)
+        step("filter", lambda: category.select(category.options[(index + i) % (len(category.options) - 1) + 1]))
+
+
+def run_apptest(sessions, iterations, recorder):
+    barrier = threading.Barrier(sessions)
+    threads = [threading.Thread(target=apptest_session, args=(i, iterations, recorder, barrier))
+               for i in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+# -- websocket driver --
+
+async def ws_session(url, index, iterations, recorder, start_event):
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    filter_widget = {}
+    project_ids = []
+
+    async def step(ws, action, query="", widget=None):
+        msg = BackMsg()
+        msg.rerun_script.query_string = query
+        if widget is not None:
+            msg.rerun_script.widget_states.widgets.append(widget)
+        start = time.perf_counter()
+        await ws.send(msg.SerializeToString())
+        size = 0
+        while True:
+            raw = await ws.recv()
+            size += len(raw)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                if element.WhichOneof("type") == "selectbox" and element.selectbox.label == FILTER_LABEL:
+                    filter_widget.update(id=element.selectbox.id, options=list(element.selectbox.options))
+                elif element.WhichOneof("type") == "button" and "btn_" in element.button.id:
+                    p_id = element.button.id.rsplit("btn_", 1)[1]
+                    if p_id.isdigit() and p_id not in project_ids:
+                        project_ids.append(p_id)
+            if kind == "script_finished" and fwd.script_finished != fwd.FINISHED_EARLY_FOR_RERUN:
+                break
+        recorder.add(action, (time.perf_counter() - start) * 1000, size)
+
+    async with websockets.connect(f"{url.rstrip('/')}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+        await start_event.wait()
+        await step(ws, "open")
+        for i in range(iterations):
+            p_id = project_ids[(index + i) % len(project_ids)] if project_ids else "1"
+            await step(ws, "view_details", f"project={p_id}")
+            await step(ws, "back")
+            if not filter_widget:
+                recorder.error()
+                continue
+            options = filter_widget["options"]
+            widget = WidgetState(id=filter_widget["id"],
+                                 string_value=options[(index + i) % (len(options) - 1) + 1])
+            await step(ws, "filter", widget=widget)
+
+
+def run_websocket(url, sessions, iterations, recorder):
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        sys.exit("the websocket driver needs the websockets package (pip install websockets)")
+
+    async def main():
+        start = asyncio.Event()
+        tasks = [asyncio.create_task(ws_session(url, i, iterations, recorder, start)) for i in range(sessions)]
+        start.set()
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"  session failed: {result!r}")
+                recorder.error()
+
+    asyncio.run(main())
+
+
+# -- reporting --
+
+def summarize(recorder, wall_s, cpu_s, rss_mb):
+    latencies = [ms for _, ms, _ in recorder.samples]
+    summary = {
+        "reruns": len(latencies),
+        "errors": recorder.errors,
+        "reruns_per_s": round(len(latencies) / wall_s, 1),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "bytes_per_rerun": round(statistics.mean(size for _, _, size in recorder.samples)),
+        "cpu_pct": round(100 * cpu_s / wall_s, 1),
+        "rss_mb": round(rss_mb, 1),
+        "actions": {},
+    }
+    for action in dict.fromkeys(a for a, _, _ in recorder.samples):
+        ms = [m for a, m, _ in recorder.samples if a == action]
+        summary["actions"][action] = {
+            "p50_ms": round(percentile(ms, 50), 1),
+            "p95_ms": round(percentile(ms, 95), 1),
+            "bytes": round(statistics.mean(s for a, _, s in recorder.samples if a == action)),
+        }
+    return summary
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def baseline_for(driver, sessions):
+    try:
+        with open(RESULTS, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file if line.strip()]
+    except OSError:
+        return None
+    matching = [r for r in records if r.get("driver") == driver and r.get("sessions") == sessions]
+    return matching[-1] if matching else None
+
+
+def report(record, baseline, tolerance):
+    print(f"{record['sessions']:>3} sessions  {record['reruns']} reruns  "
+          f"{record['reruns_per_s']} reruns/s  errors {record['errors']}")
+    for key in COMPARED:
+        line = f"    {key:<16} {record[key]:>10}"
+        if baseline and baseline.get(key):
+            change = (record[key] - baseline[key]) / baseline[key]
+            flag = "  REGRESSION" if change > tolerance else ""
+            line += f"   (base {baseline[key]} @ {baseline.get('rev')}, {change:+.0%}){flag}"
+        print(line)
+    for action, stats in record["actions"].items():
+        print(f"    {action:<16} p50 {stats['p50_ms']:7.1f} ms  p95 {stats['p95_ms']:7.1f} ms  "
+              f"{stats['bytes']:>8,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--iterations", type=int, default=5, help="view/back/filter rounds per session")
+    parser.add_argument("--url", help="ws:// or http:// base URL of a running server")
+    parser.add_argument("--server-pid", type=int, help="pid of that server, for CPU and RSS")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="flag changes above this fraction")
+    parser.add_argument("--no-save", action="store_true", help="don't append to the results file")
+    args = parser.parse_args()
+
+    driver = "websocket" if args.url else "apptest"
+    url = args.url.replace("http://", "ws://").replace("https://", "wss://") if args.url else None
+    pid = args.server_pid if args.url else None
+    if args.url and pid is None:
+        print("no --server-pid given: CPU and RSS are this client's, not the server's")
+
+    for sessions in args.sessions:
+        recorder = Recorder()
+        cpu_before, _ = process_usage(pid)
+        start = time.perf_counter()
+        if url:
+            run_websocket(url, sessions, args.iterations, recorder)
+        else:
+            run_apptest(sessions, args.iterations, recorder)
+        wall = time.perf_counter() - start
+        cpu_after, rss = process_usage(pid)
+
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "rev": git_rev(), "driver": driver,
+                  "sessions": sessions, "iterations": args.iterations,
+                  **summarize(recorder, wall, cpu_after - cpu_before, rss)}
+        report(record, baseline_for(driver, sessions), args.tolerance)
+        if not args.no_save:
+            os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+            with open(RESULTS, "a", encoding="utf-8") as file:
+                file.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
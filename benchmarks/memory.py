@@ -0,0 +1,84 @@
+"""
+Memory growth per concurrent session.
+
+Opens N AppTest sessions one after another and keeps them all alive. Each
+one views the portfolio, a project detail page (with its gallery) and
+goes back. After every session the harness records RSS, then reports the
+RSS growth per session (least-squares slope), the bytes each session's
+runs retained, and the allocation sites that retained the most, as
+attributed by memory.py. RSS includes tracemalloc's own bookkeeping, so
+compare it between revisions rather than reading it as absolute.
+
+Tracing makes runs several times slower: each session takes about 30 s,
+the first (which fills the process-wide caches) the longest, so the
+default of 3 finishes in under two minutes and 20 takes ten or more.
+A few sessions are enough for the slope; more only steady it.
+
+    python benchmarks/memory.py [--sessions 3]
+"""
+import argparse
+import os
+import statistics
+import sys
+
+# memory.py reads these at import; set them before Portfolio.py is loaded
+os.environ["PORTFOLIO_PROFILE_MEMORY"] = "1"
+os.environ.pop("PORTFOLIO_MEMORY_BUDGET_MB", None)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import memory  # noqa: E402
+
+SCRIPT = os.path.join(ROOT, "Portfolio.py")
+
+
+def slope(xs, ys):
+    mean_x, mean_y = statistics.mean(xs), statistics.mean(ys)
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / den if den else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory retained per session")
+    parser.add_argument("--sessions", type=int, default=3, help="about 30 s each")
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    alive = []
+    sites = {}
+    rows = []
+    for n in range(1, args.sessions + 1):
+        at = AppTest.from_file(SCRIPT, default_timeout=600)
+        retained = 0
+
+        def run(element=None):
+            nonlocal retained
+            (element.click() if element is not None else at).run()
+            report = memory.last_report or {}
+            retained += report.get("retained_bytes", 0)
+            for site, size in report.get("sites", {}).items():
+                sites[site] = sites.get(site, 0) + size
+
+        run()
+        ids = [b.key for b in at.button if b.key and b.key.startswith("btn_")]
+        run(at.button(key=ids[n % len(ids)]))
+        run(next(b for b in at.button if b.label.startswith("←")))
+        alive.append(at)
+        rows.append((n, memory.rss_mb(), retained))
+        print(f"{n:>3} sessions  rss {rows[-1][1]:7.1f} MB  "
+              f"this session's runs retained {retained / 1024:8.1f} KB")
+
+    # The first session pays for imports and process-wide caches
+    steady = rows[1:] if len(rows) > 2 else rows
+    xs = [n for n, _, _ in steady]
+    print(f"\nper session: rss {slope(xs, [r for _, r, _ in steady]) * 1024:.1f} KB, "
+          f"retained {statistics.mean(b for _, _, b in steady) / 1024:.1f} KB")
+    print("retained by site over all runs:")
+    for site, size in sorted(sites.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {site:<40} {size / 1024:10.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
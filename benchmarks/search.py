@@ -0,0 +1,92 @@
+"""
+Search index benchmark on a synthetic catalog.
+
+Builds an in-memory catalog of N projects by recombining the titles,
+descriptions, stacks and clients in content/projects.json (the file itself
+is left alone), then times a full build, an incremental sync after editing
+one project, and a mix of exact, prefix, fuzzy and faceted queries.
+
+    python benchmarks/search.py [--projects 1000 5000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search  # noqa: E402
+from content import load_content  # noqa: E402
+
+QUERIES = [
+    ("exact", "xgboost", None),
+    ("prefix", "forec", None),
+    ("fuzzy", "clasification", None),
+    ("multi-term", "shap healthcare", None),
+    ("facet", "", {"stack": ["Streamlit"]}),
+    ("query+facet", "detection", {"stack": ["Scikit-Learn"], "client": ["FinTech / Compliance"]}),
+]
+
+
+def synthetic_catalog(base, size, seed=0):
+    rng = random.Random(seed)
+    words = " ".join(p["desc"] for p in base).split()
+    stacks = sorted({tech for p in base for tech in p["stack"]})
+    projects = []
+    for i in range(size):
+        source = base[i % len(base)]
+        projects.append({
+            "id": i + 1,
+            "title": f"{source['title']} {rng.choice(words)} {i}",
+            "client": rng.choice(base)["client"],
+            "stack": rng.sample(stacks, 4),
+            "metric": source["metric"],
+            "desc": " ".join(rng.choices(words, k=60)),
+            "type": rng.choice(base)["type"],
+        })
+    return projects
+
+
+def timed(fn, repeat=1):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark project search")
+    parser.add_argument("--projects", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    base = load_content().projects
+    for size in args.projects:
+        projects = synthetic_catalog(base, size)
+        index = None
+
+        def build():
+            nonlocal index
+            index = search.SearchIndex(projects)
+
+        build_ms = timed(build)[0]
+        edited = [dict(p) for p in projects]
+        edited[size // 2]["title"] += " revised"
+        sync_ms = timed(lambda: index.sync(edited))[0]
+
+        print(f"{size} projects: build {build_ms:.0f} ms, incremental sync {sync_ms:.1f} ms, "
+              f"vocabulary {len(index.vocab)} tokens")
+        for label, query, filters in QUERIES:
+            samples = timed(lambda: index.search(query, filters), args.repeat)
+            samples.sort()
+            hits, _ = index.search(query, filters)
+            print(f"  {label:<12} {query!r:<20} hits {len(hits):>5}  "
+                  f"p50 {statistics.median(samples):6.2f} ms  p95 {samples[int(len(samples) * 0.95) - 1]:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Cold-start benchmark for Portfolio.py.
+
+Each sample is a fresh interpreter (like a new container or worker) that
+imports Streamlit, runs the script once through AppTest and then reruns it.
+Results are appended to benchmarks/results/startup.jsonl together with the
+git revision, and compared against the previous entry. The history is per
+machine, so benchmarks/results/ is ignored by git.
+
+    python benchmarks/startup.py [--samples 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, "benchmarks", "results", "startup.jsonl")
+
+# Runs inside the child interpreter and prints one JSON line
+CHILD = """
+import json, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+import profiling
+t1 = time.perf_counter()
+at = AppTest.from_file({script!r}, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+first = profiling.last_report
+at.run()
+t3 = time.perf_counter()
+print(json.dumps({{
+    "import_streamlit_ms": (t1 - t0) * 1000,
+    "first_run_ms": (t2 - t1) * 1000,
+    "rerun_ms": (t3 - t2) * 1000,
+    "imports_ms": first["imports_ms"],
+    "sections_ms": first["sections_ms"],
+}}))
+"""
+
+
+def sample():
+    env = dict(os.environ, PORTFOLIO_PROFILE_STARTUP="1", PYTHONPATH=ROOT)
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(script=os.path.join(ROOT, "Portfolio.py"))],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def summarize(samples):
+    keys = ("process_ms", "import_streamlit_ms", "first_run_ms", "rerun_ms")
+    summary = {key: round(statistics.median(s[key] for s in samples), 1) for key in keys}
+    # Median time of each script-level import and section across samples
+    for group in ("imports_ms", "sections_ms"):
+        names = {name for s in samples for name in s[group]}
+        summary[group] = {
+            name: round(statistics.median(s[group].get(name, 0.0) for s in samples), 1)
+            for name in sorted(names)
+        }
+    return summary
+
+
+def previous():
+    try:
+        with open(RESULTS, encoding="utf-8") as file:
+            lines = [line for line in file if line.strip()]
+        return json.loads(lines[-1]) if lines else None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Portfolio.py cold starts")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--no-save", action="store_true", help="don't append to the results file")
+    args = parser.parse_args()
+
+    summary = summarize([sample() for _ in range(args.samples)])
+    record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "rev": git_rev(),
+              "samples": args.samples, **summary}
+    baseline = previous()
+
+    for key in ("process_ms", "import_streamlit_ms", "first_run_ms", "rerun_ms"):
+        line = f"{key:<22} {record[key]:9.1f}"
+        if baseline and key in baseline:
+            line += f"   (prev {baseline[key]:.1f} @ {baseline.get('rev')})"
+        print(line)
+    for group in ("imports_ms", "sections_ms"):
+        for name, ms in sorted(record[group].items(), key=lambda item: -item[1]):
+            print(f"  {name:<30} {ms:9.1f}")
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+        with open(RESULTS, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
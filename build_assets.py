@@ -0,0 +1,213 @@
+"""
+Build recompressed, resized variants of every image the portfolio shows.
+
+Walks the profile image and every project gallery in content/, writes WebP
+and JPEG variants at several widths into static/assets/ under
+content-hashed names, and records them in static/assets/manifest.json:
+
+    {"version": 1, "assets": {<source hash>: {"source", "width", "height",
+     "bytes", "variants": [{"file", "format", "width", "height", "bytes"}]}}}
+
+Each entry also carries a "placeholder": a ~20px blurred WebP data URI
+(a few hundred bytes) that the page inlines while the real image loads.
+
+Only sources whose content hash is missing from the manifest are rebuilt,
+and variant files of entries that were dropped are deleted.
+load_image() picks the variants up at runtime via assets.manifest_entry().
+
+    python build_assets.py [--force] [--workers N]
+"""
+import argparse
+import base64
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import assets
+from content import load_content
+
+# Matches the CSS breakpoints (480/768/1024px) plus a cap for wide screens
+WIDTHS = (480, 768, 1024, 1600)
+FORMATS = ("webp", "jpeg")
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+JPEG_BACKGROUND = (11, 12, 16)  # --bg, for flattening transparent PNGs
+PLACEHOLDER_WIDTH = 20
+PLACEHOLDER_QUALITY = 40
+
+
+def collect_sources(profile, projects):
+    """Local image paths referenced by the content, in page order, deduplicated."""
+    paths = [profile["image"]]
+    for proj in projects:
+        paths.extend(proj.get("gallery", []))
+    seen = set()
+    sources = []
+    for path in paths:
+        if path.startswith(("http://", "https://")) or path in seen:
+            continue
+        seen.add(path)
+        sources.append(path)
+    return sources
+
+
+def target_widths(width):
+    cap = min(width, WIDTHS[-1])
+    return [w for w in WIDTHS if w < cap] + [cap]
+
+
+def encode(image, fmt):
+    buf = io.BytesIO()
+    if fmt == "webp":
+        image.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+    else:
+        from PIL import Image
+        if image.mode == "RGBA":
+            flat = Image.new("RGB", image.size, JPEG_BACKGROUND)
+            flat.paste(image, mask=image.getchannel("A"))
+            image = flat
+        image.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def placeholder(image):
+    """Tiny blurred preview as a data URI, stretched by the browser while loading."""
+    from PIL import ImageFilter
+
+    small = image.copy()
+    small.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH))
+    small = small.filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    small.save(buf, "WEBP", quality=PLACEHOLDER_QUALITY)
+    return "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode()
+
+
+def build_variants(path, digest):
+    """Worker: resize and recompress one source. Runs in a child process."""
+    from PIL import Image
+
+    with Image.open(os.path.join(assets.APP_DIR, path)) as source:
+        source.load()
+        width, height = source.size
+        has_alpha = "A" in source.getbands() or "transparency" in source.info
+        image = source.convert("RGBA" if has_alpha else "RGB")
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    variants = []
+    for w in target_widths(width):
+        h = round(height * w / width)
+        resized = image if w == width else image.resize((w, h), Image.LANCZOS)
+        for fmt in FORMATS:
+            data = encode(resized, fmt)
+            ext = "webp" if fmt == "webp" else "jpg"
+            name = assets.hashed_name(f"{stem}-{w}w.{ext}", assets.content_hash(data))
+            assets.write_static(name, data)
+            variants.append({"file": name, "format": fmt, "width": w, "height": h, "bytes": len(data)})
+
+    return digest, {
+        "source": path,
+        "width": width,
+        "height": height,
+        "bytes": os.path.getsize(os.path.join(assets.APP_DIR, path)),
+        "variants": variants,
+        "placeholder": placeholder(image),
+    }
+
+
+def read_manifest():
+    try:
+        with open(assets.MANIFEST_PATH, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {"version": 1, "assets": {}}
+
+
+def write_manifest(manifest):
+    os.makedirs(assets.STATIC_ASSET_DIR, exist_ok=True)
+    tmp = assets.MANIFEST_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(tmp, assets.MANIFEST_PATH)
+
+
+def is_current(entry):
+    return entry is not None and "placeholder" in entry and all(
+        os.path.exists(os.path.join(assets.STATIC_ASSET_DIR, v["file"])) for v in entry["variants"]
+    )
+
+
+def prune(old, entries):
+    """Delete variant files listed in old but in none of entries. Returns their names."""
+    keep = {v["file"] for entry in entries.values() for v in entry["variants"]}
+    removed = []
+    for entry in old.values():
+        for variant in entry.get("variants", []):
+            name = variant["file"]
+            if name in keep or name in removed:
+                continue
+            try:
+                os.remove(os.path.join(assets.STATIC_ASSET_DIR, name))
+            except FileNotFoundError:
+                pass
+            removed.append(name)
+    return removed
+
+
+def build(sources, force=False, workers=None):
+    """Build stale sources in parallel and rewrite the manifest. Returns (built, reused)."""
+    old = read_manifest()["assets"]
+    entries = {}
+    todo = []
+    queued = set()
+    for path in sources:
+        full = os.path.join(assets.APP_DIR, path)
+        if not os.path.exists(full):
+            print(f"  missing: {path}")
+            continue
+        digest = assets.file_hash(full)
+        if digest in entries or digest in queued:
+            continue  # same bytes under another path: one entry serves both
+        if not force and is_current(old.get(digest)):
+            entries[digest] = old[digest]
+        else:
+            todo.append((path, digest))
+            queued.add(digest)
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(build_variants, path, digest) for path, digest in todo]
+            for future in futures:
+                digest, entry = future.result()
+                entries[digest] = entry
+                print(f"  built: {entry['source']} ({len(entry['variants'])} variants)")
+
+    # Drop entries for sources no longer referenced so the manifest stays
+    # small, then their files, which static/assets/ would otherwise keep serving
+    write_manifest({"version": 1, "assets": entries})
+    removed = prune(old, entries)
+    if removed:
+        print(f"  pruned: {len(removed)} variant files no longer referenced")
+    return len(todo), len(entries) - len(todo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build optimized image variants")
+    parser.add_argument("--force", action="store_true", help="rebuild every source")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    content = load_content()
+    built, reused = build(collect_sources(content.profile, content.projects), args.force, args.workers)
+
+    manifest = read_manifest()["assets"].values()
+    original = sum(e["bytes"] for e in manifest)
+    largest = sum(max(v["bytes"] for v in e["variants"] if v["format"] == "webp") for e in manifest)
+    print(f"{built} built, {reused} unchanged in {time.perf_counter() - start:.1f}s")
+    print(f"full-size bytes: {original:,} original -> {largest:,} webp")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Server-rendered SVG charts for Portfolio.py.
+
+The SVG is plain markup, so it costs no client-side charting bundle and is
+colored through the page's CSS variables (--accent, --text). Rendering is
+memoized on the input values, so each chart is built once per process.
+"""
+import functools
+import html
+import math
+
+SIZE = 300
+PADDING = 70  # room for axis labels around the plot area
+
+
+def _point(cx, cy, radius, angle):
+    return cx + radius * math.cos(angle), cy + radius * math.sin(angle)
+
+
+def _polygon(points):
+    return " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+
+
+@functools.lru_cache(maxsize=32)
+def radar_svg(categories, values, max_value=5, height=SIZE):
+    """
+    Radar chart as an inline <svg>. categories and values must be tuples
+    (they are the memoization key). Axes start at 12 o'clock, clockwise.
+    """
+    cx = cy = SIZE / 2
+    radius = SIZE / 2 - PADDING / 2
+    # Angle per axis, starting at the top
+    angles = [-math.pi / 2 + 2 * math.pi * i / len(categories) for i in range(len(categories))]
+
+    parts = []
+    for level in range(1, max_value + 1):
+        ring = [_point(cx, cy, radius * level / max_value, a) for a in angles]
+        parts.append(f'<polygon points="{_polygon(ring)}" style="fill:none; stroke:#333; stroke-width:1;"/>')
+    for a in angles:
+        x, y = _point(cx, cy, radius, a)
+        parts.append(f'<line x1="{cx}" y1="{cy}" x2="{x:.1f}" y2="{y:.1f}" style="stroke:#333; stroke-width:1;"/>')
+
+    shape = [_point(cx, cy, radius * min(v, max_value) / max_value, a) for v, a in zip(values, angles)]
+    parts.append(
+        f'<polygon points="{_polygon(shape)}" style="fill:var(--accent, #66fcf1); fill-opacity:0.2; '
+        f'stroke:var(--accent, #66fcf1); stroke-width:2;"/>'
+    )
+
+    for label, a in zip(categories, angles):
+        x, y = _point(cx, cy, radius + 14, a)
+        cos = math.cos(a)
+        anchor = "middle" if abs(cos) < 0.3 else ("start" if cos > 0 else "end")
+        baseline = "auto" if math.sin(a) < -0.3 else ("hanging" if math.sin(a) > 0.3 else "middle")
+        parts.append(
+            f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" dominant-baseline="{baseline}" '
+            f'style="fill:var(--text, #c5c6c7); font-size:10px; font-family:Inter, sans-serif;">'
+            f'{html.escape(str(label))}</text>'
+        )
+
+    return (
+        f'<svg viewBox="{-PADDING} 0 {SIZE + 2 * PADDING} {SIZE}" width="100%" height="{height}" '
+        f'role="img" aria-label="Skills radar chart" xmlns="http://www.w3.org/2000/svg">'
+        + "".join(parts)
+        + "</svg>"
+    )
@@ -0,0 +1,168 @@
+"""
+Portfolio content loaded from the JSON files in content/.
+
+load_content() validates the files against a small schema, builds lookup
+indexes once, and caches the result on the files' mtimes. Editing a file
+is picked up on the next rerun without a restart; if the edit is invalid
+the last good content keeps being served and the error is logged.
+"""
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+FILES = {
+    "profile": "profile.json",
+    "projects": "projects.json",
+    "experience": "experience.json",
+    "testimonials": "testimonials.json",
+}
+
+# field -> (type, required); str fields must also be non-empty
+PROFILE_SCHEMA = {
+    "name": (str, True), "title": (str, True), "tagline": (str, True),
+    "image": (str, True), "resume_path": (str, True), "about": (str, True),
+    "socials": (dict, True), "skills": (dict, False), "radar": (dict, False),
+}
+PROJECT_SCHEMA = {
+    "id": (int, True), "title": (str, True), "client": (str, True),
+    "stack": (list, True), "metric": (str, True), "desc": (str, True),
+    "type": (str, True), "github": (str, False), "gallery": (list, False),
+}
+EXPERIENCE_SCHEMA = {
+    "role": (str, True), "company": (str, True), "year": (str, True), "impact": (str, True),
+}
+TESTIMONIAL_SCHEMA = {"quote": (str, True), "author": (str, True)}
+
+logger = logging.getLogger("portfolio.content")
+
+
+class ContentError(ValueError):
+    """A content file is missing, unreadable or doesn't match the schema."""
+
+
+def category_of(project):
+    """Primary category: the first segment of 'Classification / Healthcare'."""
+    return project["type"].split(" / ")[0]
+
+
+@dataclass
+class Content:
+    profile: dict
+    projects: list
+    experience: list
+    testimonials: list
+    by_id: dict = field(default_factory=dict)
+    by_category: dict = field(default_factory=dict)
+    by_stack: dict = field(default_factory=dict)
+    by_client: dict = field(default_factory=dict)
+    categories: list = field(default_factory=list)
+
+    def __post_init__(self):
+        for proj in self.projects:
+            self.by_id[proj["id"]] = proj
+            self.by_category.setdefault(category_of(proj), []).append(proj)
+            for tech in proj["stack"]:
+                self.by_stack.setdefault(tech, []).append(proj)
+            self.by_client.setdefault(proj["client"], []).append(proj)
+        # First-seen order keeps the filter options stable between runs
+        self.categories = list(self.by_category)
+
+
+def _check(record, schema, where):
+    if not isinstance(record, dict):
+        raise ContentError(f"{where}: expected an object")
+    for key, (kind, required) in schema.items():
+        if key not in record:
+            if required:
+                raise ContentError(f"{where}: missing '{key}'")
+            continue
+        value = record[key]
+        # bool is an int subclass; an id of true is almost certainly a typo
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            raise ContentError(f"{where}: '{key}' must be {kind.__name__}")
+        if kind is str and not value.strip() and required:
+            raise ContentError(f"{where}: '{key}' is empty")
+    unknown = set(record) - set(schema)
+    if unknown:
+        raise ContentError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+
+
+def _check_list(records, schema, name):
+    if not isinstance(records, list):
+        raise ContentError(f"{name}: expected a list")
+    for i, record in enumerate(records):
+        _check(record, schema, f"{name}[{i}]")
+
+
+def validate(data):
+    _check(data["profile"], PROFILE_SCHEMA, "profile")
+    if not all(isinstance(v, str) for v in data["profile"]["socials"].values()):
+        raise ContentError("profile: socials must map names to URLs")
+    for key in ("skills", "radar"):
+        levels = data["profile"].get(key, {}).values()
+        if not all(isinstance(v, int) and not isinstance(v, bool) for v in levels):
+            raise ContentError(f"profile: {key} must map names to integer levels")
+    _check_list(data["projects"], PROJECT_SCHEMA, "projects")
+    _check_list(data["experience"], EXPERIENCE_SCHEMA, "experience")
+    _check_list(data["testimonials"], TESTIMONIAL_SCHEMA, "testimonials")
+
+    seen = set()
+    for proj in data["projects"]:
+        if proj["id"] in seen:
+            raise ContentError(f"projects: duplicate id {proj['id']}")
+        seen.add(proj["id"])
+        for key in ("stack", "gallery"):
+            if not all(isinstance(item, str) for item in proj.get(key, [])):
+                raise ContentError(f"projects[id={proj['id']}]: '{key}' must be a list of strings")
+
+
+def read(directory=CONTENT_DIR):
+    data = {}
+    for name, filename in FILES.items():
+        path = os.path.join(directory, filename)
+        try:
+            with open(path, encoding="utf-8") as file:
+                data[name] = json.load(file)
+        except OSError as e:
+            raise ContentError(f"{filename}: {e.strerror}") from e
+        except ValueError as e:
+            raise ContentError(f"{filename}: {e}") from e
+    validate(data)
+    return Content(**data)
+
+
+_cache = {"key": None, "content": None}
+_lock = threading.Lock()
+
+
+def _mtimes(directory):
+    stamps = []
+    for filename in FILES.values():
+        try:
+            stamps.append(os.stat(os.path.join(directory, filename)).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def load_content(directory=CONTENT_DIR):
+    """Validated, indexed content; re-read only when a file's mtime changes."""
+    key = (directory, _mtimes(directory))
+    with _lock:
+        if _cache["key"] == key and _cache["content"] is not None:
+            return _cache["content"]
+        try:
+            content = read(directory)
+        except ContentError:
+            if _cache["content"] is None:
+                raise
+            logger.exception("Invalid content edit, still serving the previous version")
+            # Don't retry the broken files on every rerun
+            _cache["key"] = key
+            return _cache["content"]
+        _cache["key"] = key
+        _cache["content"] = content
+        return content
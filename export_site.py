@@ -0,0 +1,308 @@
+"""
+Export the portfolio as a self-contained static site.
+
+Renders the portfolio page, one page per project, the stylesheet and the
+optimized images into a directory that any static file server or CDN can
+serve with no Python per request:
+
+    site/index.html            hero, every project, timeline, testimonials
+    site/project-<id>.html     project detail pages
+    site/assets/               content-hashed CSS, image variants, resume
+
+Every HTML and CSS file gets precompressed .gz/.br siblings (see
+precompress.py) for servers that negotiate them.
+
+Images go through build_assets.py first, so the pages get the same
+responsive <picture> markup as the live app. Features that need the
+Streamlit server degrade: search, filters and grid paging become one full
+project list, the contact form leaves only the email link, the gallery
+lightbox opens the full-size image, and ?project=<id> links are redirected
+to the matching detail page.
+
+    python export_site.py [--out site] [--no-build]
+"""
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import time
+
+import assets
+import build_assets
+import charts
+import precompress
+import templates
+from content import load_content
+from templates import Markup, Template, escape
+from theme import CUSTOM_CSS
+
+ASSET_DIR = "assets"
+# Written into every export; only a directory holding it is ever replaced
+MARKER = ".portfolio-export"
+
+# Layout the live app gets from Streamlit's containers and widgets
+EXPORT_CSS = """
+body {margin: 0;}
+.page {max-width: 1200px; margin: 0 auto; padding: 1rem 1.5rem 0;}
+.columns {display: grid; grid-template-columns: 3fr 2fr; gap: 3rem; align-items: start;}
+.columns.wide {grid-template-columns: 2fr 1fr;}
+.project-grid {display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 1.5rem;}
+.card-actions, .actions {display: flex; gap: 0.75rem; align-items: center; margin-top: 0.75rem; flex-wrap: wrap;}
+.button {display: inline-block; padding: 6px 14px; border-radius: 6px; border: 1px solid rgba(102, 252, 241, 0.3);
+    background: rgba(102, 252, 241, 0.1); color: var(--accent); font-weight: 600; font-size: 0.9rem; text-decoration: none;}
+.button:hover {background: rgba(102, 252, 241, 0.2); border-color: var(--accent);}
+.button.disabled {opacity: 0.4; pointer-events: none;}
+a.gallery-link {display: block;}
+@media (max-width: 768px) {
+    .columns, .columns.wide {grid-template-columns: 1fr; gap: 1.5rem;}
+}
+"""
+
+PAGE = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="icon" href="data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E%3Ctext y='.9em' font-size='90'%3E%E2%9A%A1%3C/text%3E%3C/svg%3E">
+<link rel="stylesheet" href="{stylesheet}">
+{head}
+</head>
+<body>
+<main class="page">
+{body}
+</main>
+</body>
+</html>
+""")
+
+# Streamlit-era deep links (?project=3) land on the static detail page
+REDIRECT = Markup(
+    '<script>var m = location.search.match(/[?&]project=(\\d+)/); '
+    'if (m) location.replace("project-" + m[1] + ".html");</script>'
+)
+
+PROFILE_SIZES = "(max-width: 480px) 150px, (max-width: 768px) 180px, 220px"
+GALLERY_SIZES = "(max-width: 768px) 100vw, 60vw"
+
+
+class ExportError(RuntimeError):
+    """The output directory can't safely be written."""
+
+
+def check_replaceable(out_dir):
+    """Raise ExportError unless out_dir is missing, empty or an earlier export."""
+    if not os.path.lexists(out_dir):
+        return
+    if not os.path.isdir(out_dir) or os.path.islink(out_dir):
+        raise ExportError(f"{out_dir} exists and is not a directory")
+    if os.listdir(out_dir) and not os.path.isfile(os.path.join(out_dir, MARKER)):
+        raise ExportError(f"refusing to replace {out_dir}: it is not empty and has no {MARKER} "
+                          f"marker from an earlier export; pick a new or empty --out directory")
+
+
+def page_name(proj):
+    return f"project-{proj['id']}.html"
+
+
+def inline_markdown(text):
+    """Escaped text with the *emphasis* and **bold** the descriptions use."""
+    text = str(escape(text))
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return Markup(re.sub(r"\*(.+?)\*", r"<em>\1</em>", text))
+
+
+class SiteExport:
+    """Collects pages and assets for one export into out_dir."""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.asset_dir = os.path.join(out_dir, ASSET_DIR)
+        os.makedirs(self.asset_dir, exist_ok=True)
+        self.files = 0
+
+    def write(self, name, data):
+        path = os.path.join(self.out_dir, name)
+        with open(path, "wb") as file:
+            file.write(data)
+        self.files += 1
+
+    def add_asset(self, name, data):
+        """Write bytes under assets/ once and return the page-relative URL."""
+        target = os.path.join(self.asset_dir, name)
+        if not os.path.exists(target):
+            self.write(os.path.join(ASSET_DIR, name), data)
+        return f"{ASSET_DIR}/{name}"
+
+    def copy_file(self, path):
+        with open(path, "rb") as file:
+            data = file.read()
+        return self.add_asset(assets.hashed_name(path, assets.content_hash(data)), data)
+
+    def copy_variants(self, entry):
+        for variant in entry["variants"]:
+            source = os.path.join(assets.STATIC_ASSET_DIR, variant["file"])
+            if not os.path.exists(os.path.join(self.asset_dir, variant["file"])):
+                shutil.copyfile(source, os.path.join(self.asset_dir, variant["file"]))
+                self.files += 1
+
+    def image(self, path, sizes, attrs="", style=""):
+        """(image markup, full-size URL) for a content image, like image_html()."""
+        if path.startswith(("http://", "https://")):
+            url = escape(path)
+            return Markup(f'<img src="{url}" style="{style}" {attrs}>'), url
+        full = os.path.join(assets.APP_DIR, path)
+        if not os.path.exists(full):
+            url = "https://placehold.co/400x400/1f2833/66fcf1?text=Image"
+            return Markup(f'<img src="{url}" style="{style}" {attrs}>'), url
+        entry = assets.manifest_entry(full)
+        if entry:
+            self.copy_variants(entry)
+            base = f"{ASSET_DIR}/"
+            return (Markup(assets.picture_html(entry, sizes, attrs, style, base)),
+                    base + assets.largest_variant(entry, "webp")["file"])
+        url = self.copy_file(full)
+        size = assets.image_size(full)
+        dims = f'width="{size[0]}" height="{size[1]}" ' if size else ""
+        return Markup(f'<img src="{escape(url)}" {dims}style="{style}" {attrs}>'), url
+
+    def page(self, name, title, body, stylesheet, head=""):
+        html = PAGE.render(title=title, stylesheet=stylesheet, head=Markup(head), body=Markup(body))
+        self.write(name, html.encode("utf-8"))
+
+
+def project_card(proj):
+    code = (f'<a class="button" href="{escape(templates.safe_url(proj["github"]))}" target="_blank">Code ↗</a>'
+            if templates.has_github(proj) else '<span class="button disabled">Demo</span>')
+    return (
+        f'<div>{templates.project_fragment("card", proj)}'
+        f'<div class="card-actions"><a class="button" href="{page_name(proj)}">View Details</a>{code}</div></div>'
+    )
+
+
+def index_body(site, content):
+    profile = content.profile
+    mobile_img, _ = site.image(profile["image"], PROFILE_SIZES,
+                               'class="profile-img-mobile magnetic-element" alt="Profile photo"')
+    profile_img, _ = site.image(profile["image"], PROFILE_SIZES,
+                                'class="profile-img magnetic-element" alt="Profile photo"')
+
+    resume = assets.app_path(profile["resume_path"])
+    actions = ""
+    if resume:
+        actions = f'<a class="button" href="{escape(site.copy_file(resume))}" download="Muzammil_Resume.pdf">📄 Download CV</a>'
+    actions += f'<div>{templates.socials(profile["socials"])}</div>'
+
+    radar = profile.get("radar", {})
+    chart = charts.radar_svg(tuple(radar), tuple(radar.values())) if radar else ""
+
+    return "\n".join([
+        '<section class="columns">',
+        f'<div>{templates.hero_intro(profile, mobile_img)}<div class="actions">{actions}</div></div>',
+        f'<div><div class="profile-img-container">{profile_img}</div>{chart}</div>',
+        "</section>",
+        templates.section_header("Featured Projects"),
+        '<div class="project-grid">',
+        *(project_card(proj) for proj in content.projects),
+        "</div>",
+        templates.section_header("Journey"),
+        templates.timeline(content.experience),
+        templates.section_header("What People Say"),
+        templates.testimonials(content.testimonials),
+        templates.section_header("Let's Work Together"),
+        '<div class="columns"><p>Ready to transform your data strategy? Reach out directly via email.</p>',
+        f'<div>{templates.email_box(profile["socials"]["Email"])}</div></div>',
+        templates.FOOTER.render(),
+    ])
+
+
+def detail_body(site, proj):
+    gallery = []
+    for idx, path in enumerate(proj.get("gallery", [])):
+        loading = 'fetchpriority="high"' if idx == 0 else 'loading="lazy" decoding="async"'
+        img, full_url = site.image(path, GALLERY_SIZES, loading,
+                                   "width:100%; height:auto; display:block; transition: transform 0.3s ease;")
+        # The lightbox needs Python; the image links to its full-size file instead
+        gallery.append(f'<a class="gallery-link" href="{escape(full_url)}" target="_blank">'
+                       f'{templates.GALLERY_IMAGE.render(image=img)}</a>')
+
+    code = templates.project_fragment("detail_github", proj) if templates.has_github(proj) else ""
+    return "\n".join([
+        f'<div class="actions"><a class="button" href="index.html">← Back</a>{code}</div><br>',
+        '<div class="columns wide">',
+        f'<div>{templates.project_fragment("detail_title", proj)}</div>',
+        f'<div>{templates.project_fragment("detail_metric", proj)}</div>',
+        "</div><hr>",
+        '<div class="columns wide">',
+        f'<div><h3>The Problem &amp; Solution</h3><p>{inline_markdown(proj["desc"])}</p>',
+        *(["<br><h3>Visual Evidence</h3>", *gallery] if gallery else []),
+        "</div>",
+        f'<div><h3>Technology Stack</h3>{templates.project_fragment("stack", proj)}</div>',
+        "</div>",
+    ])
+
+
+def export(out_dir, build=True):
+    """
+    Render the whole site into out_dir, replacing it only once complete.
+    An existing out_dir is only replaced if it is empty or an earlier export.
+    """
+    out_dir = os.path.abspath(out_dir)
+    check_replaceable(out_dir)
+    content = load_content()
+    if build:
+        build_assets.build(build_assets.collect_sources(content.profile, content.projects))
+
+    parent = os.path.dirname(out_dir)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f".{os.path.basename(out_dir)}-", dir=parent)
+    try:
+        files = _render(staging, content)
+        check_replaceable(out_dir)  # in case it changed while rendering
+        if os.path.lexists(out_dir):
+            shutil.rmtree(out_dir)
+        os.replace(staging, out_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return files
+
+
+def _render(staging, content):
+    site = SiteExport(staging)
+
+    css = assets.minify_css(CUSTOM_CSS + EXPORT_CSS).encode()
+    stylesheet = site.add_asset(assets.hashed_name("portfolio.css", assets.content_hash(css)), css)
+
+    title = f"{content.profile['name']} | Data Science"
+    site.page("index.html", title, index_body(site, content), stylesheet, head=REDIRECT)
+    for proj in content.projects:
+        site.page(page_name(proj), f"{proj['title']} | {title}", detail_body(site, proj), stylesheet)
+
+    precompress.precompress_tree(staging)
+    with open(os.path.join(staging, MARKER), "w", encoding="utf-8") as file:
+        file.write("Written by export_site.py; the next export replaces this directory.\n")
+    os.chmod(staging, 0o755)  # mkdtemp creates it private
+    return site.files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site")
+    parser.add_argument("--out", default=os.path.join(assets.APP_DIR, "site"), help="output directory")
+    parser.add_argument("--no-build", action="store_true",
+                        help="skip build_assets.py and use the variants already built")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        files = export(args.out, build=not args.no_build)
+    except ExportError as e:
+        parser.exit(1, f"export_site.py: {e}\n")
+    size = sum(os.path.getsize(os.path.join(d, f)) for d, _, names in os.walk(args.out) for f in names)
+    print(f"{files} files, {size:,} bytes in {args.out} ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
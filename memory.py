@@ -0,0 +1,297 @@
+"""
+Opt-in memory diagnostics and a per-process memory budget for Portfolio.py.
+
+PORTFOLIO_PROFILE_MEMORY=1 traces allocations with tracemalloc. Traces are
+cleared when a full script run starts, so the snapshot taken when it ends
+holds exactly the bytes that run allocated and kept alive. They are
+attributed to the innermost draw_*/load_* function on their allocation
+stack (or the innermost app function, or "external") and logged with each
+session's accumulated footprint. Traces are process-wide: runs of other
+sessions in flight at the same time are counted too, so profile with one
+active session (benchmarks/memory.py runs them one after another).
+
+PORTFOLIO_MEMORY_BUDGET_MB sets an RSS budget. When a run ends over budget,
+the least recently active session idle for PORTFOLIO_SESSION_IDLE_SECONDS
+(default 300) is closed. Closing happens later on the event loop and freed
+memory isn't always returned to the OS, so at most EVICTIONS_PER_RUN
+sessions go per run and RSS is checked again by the next one. A closed
+session's browser tab reconnects with a fresh session on its next action.
+Fragment reruns skip RerunMemory.finish(), so each fragment calls touch()
+to keep its session from looking idle.
+
+With neither variable set every hook is a no-op.
+"""
+import ast
+import asyncio
+import logging
+import os
+import resource
+import threading
+import time
+import tracemalloc
+
+
+def _float_from_env(name, default):
+    """A non-negative float from the environment; default if unset or not a number."""
+    try:
+        return max(0.0, float(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+PROFILE = os.environ.get("PORTFOLIO_PROFILE_MEMORY") == "1"
+BUDGET_MB = _float_from_env("PORTFOLIO_MEMORY_BUDGET_MB", 0.0) or None
+IDLE_SECONDS = _float_from_env("PORTFOLIO_SESSION_IDLE_SECONDS", 300.0)
+ENABLED = PROFILE or BUDGET_MB is not None
+
+# Sessions unseen this long are dropped from the registry (they disconnected)
+FORGET_SECONDS = 24 * 3600
+EVICTIONS_PER_RUN = 1
+TRACE_FRAMES = 24
+TOP_SITES = 8
+SITE_PREFIXES = ("draw_", "load_")
+
+THIS_FILE = os.path.abspath(__file__)
+APP_DIR = os.path.dirname(THIS_FILE)
+
+logger = logging.getLogger("portfolio.memory")
+if ENABLED and not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+
+# as_dict() of the most recent finished run, read by benchmarks/memory.py
+last_report = None
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # peak on Linux
+
+
+# -- attribution --
+
+_functions = {}   # filename -> sorted [(first line, last line, name)]
+_functions_lock = threading.Lock()
+
+
+def _function_spans(filename):
+    with _functions_lock:
+        spans = _functions.get(filename)
+        if spans is None:
+            try:
+                with open(filename, encoding="utf-8") as file:
+                    tree = ast.parse(file.read())
+                spans = sorted(
+                    (node.lineno, node.end_lineno, node.name) for node in ast.walk(tree)
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                )
+            except (OSError, SyntaxError, ValueError):
+                spans = []
+            _functions[filename] = spans
+        return spans
+
+
+def _enclosing_function(filename, lineno):
+    """Innermost function defined around lineno, or None."""
+    best = None
+    for first, last, name in _function_spans(filename):
+        if first > lineno:
+            break
+        if lineno <= last:
+            best = name
+    return best
+
+
+def attribute(traceback):
+    """
+    Allocation site label for a tracemalloc traceback (oldest frame first),
+    or None for this module's own bookkeeping.
+    """
+    fallback = None
+    for frame in reversed(traceback):
+        if frame.filename == THIS_FILE:
+            return None
+        if not frame.filename.startswith(APP_DIR):
+            continue
+        name = _enclosing_function(frame.filename, frame.lineno)
+        if name and name.startswith(SITE_PREFIXES):
+            return name
+        if fallback is None:
+            fallback = f"{os.path.basename(frame.filename)}:{name or '<module>'}"
+    return fallback or "external"
+
+
+# -- sessions --
+
+class SessionRegistry:
+    """Last activity, run count and retained bytes per session id."""
+
+    def __init__(self):
+        self.sessions = {}
+        self._lock = threading.Lock()
+
+    def touch(self, session_id, retained=0):
+        with self._lock:
+            now = time.monotonic()
+            if session_id not in self.sessions and len(self.sessions) % 256 == 255:
+                for sid in [s for s, e in self.sessions.items() if now - e["last_seen"] > FORGET_SECONDS]:
+                    del self.sessions[sid]
+            entry = self.sessions.setdefault(session_id, {"runs": 0, "retained_bytes": 0})
+            entry["runs"] += 1
+            entry["retained_bytes"] += retained
+            entry["last_seen"] = now
+            return dict(entry)
+
+    def seen(self, session_id):
+        """Mark activity without counting a run (fragment reruns)."""
+        with self._lock:
+            entry = self.sessions.setdefault(session_id, {"runs": 0, "retained_bytes": 0})
+            entry["last_seen"] = time.monotonic()
+
+    def idle(self, seconds, exclude=None):
+        """Ids idle for at least seconds, least recently active first."""
+        now = time.monotonic()
+        with self._lock:
+            rows = sorted((entry["last_seen"], sid) for sid, entry in self.sessions.items()
+                          if sid != exclude and now - entry["last_seen"] >= seconds)
+        return [sid for _, sid in rows]
+
+    def forget(self, session_id):
+        with self._lock:
+            return self.sessions.pop(session_id, None)
+
+    def snapshot(self):
+        with self._lock:
+            return {sid: dict(entry) for sid, entry in self.sessions.items()}
+
+
+sessions = SessionRegistry()
+
+
+def _evict(runtime, session_id):
+    info = runtime._session_mgr.get_session_info(session_id)
+    client = info.client if info else None
+    runtime.close_session(session_id)
+    # Drop the connection as well, or the tab keeps talking to a session that
+    # no longer exists; the frontend reconnects and gets a fresh one
+    if client is None:
+        return
+    if hasattr(client, "_websocket"):  # Starlette server
+        asyncio.ensure_future(client._websocket.close(code=1001))
+    elif callable(getattr(client, "close", None)):  # Tornado handler
+        client.close()
+
+
+def _close_session(session_id):
+    """Shut a session down on the Streamlit event loop (the runtime isn't thread-safe)."""
+    from streamlit.runtime import Runtime
+
+    if not Runtime.exists():
+        return False
+    runtime = Runtime.instance()
+    try:
+        loop = runtime._get_async_objs().eventloop
+    except Exception:
+        return False
+    loop.call_soon_threadsafe(_evict, runtime, session_id)
+    return True
+
+
+def enforce_budget(current_session=None):
+    """
+    Close up to EVICTIONS_PER_RUN idle sessions if RSS is over budget.
+    Returns the ids closed.
+    """
+    if BUDGET_MB is None or rss_mb() <= BUDGET_MB:
+        return []
+    closed = []
+    for session_id in sessions.idle(IDLE_SECONDS, exclude=current_session):
+        if len(closed) >= EVICTIONS_PER_RUN:
+            break
+        entry = sessions.forget(session_id)
+        if _close_session(session_id):
+            closed.append(session_id)
+            logger.info("memory budget %.0f MB exceeded: closed idle session %s (%d runs, %.1f KB retained)",
+                        BUDGET_MB, session_id, entry["runs"], entry["retained_bytes"] / 1024)
+    return closed
+
+
+# -- per-run hook --
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else None
+
+
+def touch():
+    """Record activity of the current session; call at the top of every fragment."""
+    if not ENABLED:
+        return
+    session_id = _session_id()
+    if session_id is not None:
+        sessions.seen(session_id)
+
+
+class RerunMemory:
+    """Create at the top of the script and call finish() at the end."""
+
+    def __init__(self):
+        self.session_id = None
+        self.tracing = False
+        self.sites = []
+        self.retained = 0
+        if not ENABLED:
+            return
+        self.session_id = _session_id()
+        if PROFILE:
+            # Started on the first run, after the heavy imports, so their
+            # allocations aren't traced
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACE_FRAMES)
+            tracemalloc.clear_traces()
+            self.tracing = True
+
+    def finish(self):
+        global last_report
+        if not ENABLED:
+            return
+        if self.tracing:
+            by_site = {}
+            for stat in tracemalloc.take_snapshot().statistics("traceback"):
+                site = attribute(stat.traceback)
+                if site is not None:
+                    by_site[site] = by_site.get(site, 0) + stat.size
+            self.sites = sorted(by_site.items(), key=lambda item: -item[1])
+            self.retained = sum(by_site.values())
+        footprint = sessions.touch(self.session_id, self.retained)
+        closed = enforce_budget(self.session_id)
+
+        if PROFILE:
+            last_report = self.as_dict(footprint, closed)
+            lines = [f"run retained {self.retained / 1024:.1f} KB, rss {last_report['rss_mb']:.1f} MB, "
+                     f"session {self.session_id}: {footprint['runs']} runs, "
+                     f"{footprint['retained_bytes'] / 1024:.1f} KB retained"]
+            for site, size in self.sites[:TOP_SITES]:
+                lines.append(f"  {site:<40} {size / 1024:10.1f} KB")
+            logger.info("\n".join(lines))
+
+    def as_dict(self, footprint, closed):
+        return {
+            "session_id": self.session_id,
+            "retained_bytes": self.retained,
+            "sites": dict(self.sites),
+            "session": footprint,
+            "sessions": len(sessions.sessions),
+            "closed": closed,
+            "rss_mb": round(rss_mb(), 1),
+        }
@@ -0,0 +1,230 @@
+"""
+Opt-in runtime metrics for Portfolio.py.
+
+With PORTFOLIO_METRICS=1, every function wrapped in instrument() records
+its wall time and the number and serialized bytes of the Streamlit
+elements it emitted. The samples go into process-wide histograms, served
+in Prometheus text format at /metrics (and as JSON at /metrics.json) when
+PORTFOLIO_METRICS_PORT is set. PORTFOLIO_METRICS_LOG=1 additionally
+logs one JSON line per call. Disabled, instrument() returns the function
+itself, so there is no per-call cost.
+
+Counters (increment()) are always kept, since they cost one dict update,
+and are served alongside the histograms.
+"""
+import bisect
+import functools
+import http.server
+import json
+import logging
+import os
+import threading
+import time
+
+
+def _port_from_env():
+    try:
+        return int(os.environ.get("PORTFOLIO_METRICS_PORT", "0")) or None
+    except ValueError:
+        return None
+
+
+PORT = _port_from_env()
+ENABLED = os.environ.get("PORTFOLIO_METRICS") == "1" or PORT is not None
+LOG_CALLS = ENABLED and os.environ.get("PORTFOLIO_METRICS_LOG") == "1"
+
+logger = logging.getLogger("portfolio.metrics")
+if LOG_CALLS and not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+
+# Upper bounds per histogram; +Inf is implied
+BUCKETS = {
+    "seconds": (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    "elements": (0, 1, 2, 5, 10, 25, 50, 100),
+    "bytes": (0, 256, 1024, 4096, 16384, 65536, 262144, 1048576),
+}
+HELP = {
+    "seconds": "Wall time per call",
+    "elements": "Streamlit elements emitted per call",
+    "bytes": "Serialized bytes of the elements emitted per call",
+}
+COUNTERS = {
+    "portfolio_rate_limit_total": "Rate-limited interactions by action and outcome (served or rejected)",
+}
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """[(upper bound, cumulative count)] ending with +Inf."""
+        total, rows = 0, []
+        for bound, count in zip(list(self.bounds) + [float("inf")], self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+
+class Registry:
+    """
+    Histograms keyed on (unit, function name), and counters keyed on
+    (metric, labels).
+    """
+
+    def __init__(self):
+        self._histograms = {}
+        self._counters = {}   # (metric, sorted label items) -> count
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, elements, size):
+        with self._lock:
+            for unit, value in (("seconds", seconds), ("elements", elements), ("bytes", size)):
+                histogram = self._histograms.get((unit, name))
+                if histogram is None:
+                    histogram = self._histograms[(unit, name)] = Histogram(BUCKETS[unit])
+                histogram.observe(value)
+
+    def increment(self, metric, **labels):
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def snapshot(self):
+        """
+        {function: {unit: {"count", "sum", "buckets": {bound: cumulative}}}},
+        plus {counter metric: {"label=value,...": count}}
+        """
+        with self._lock:
+            out = {}
+            for (unit, name), h in sorted(self._histograms.items(), key=lambda item: item[0][::-1]):
+                out.setdefault(name, {})[unit] = {
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "buckets": {_bound(bound): n for bound, n in h.cumulative()},
+                }
+            for (metric, labels), n in sorted(self._counters.items()):
+                out.setdefault(metric, {})[",".join(f"{k}={v}" for k, v in labels)] = n
+            return out
+
+    def prometheus(self):
+        """The histograms and counters in Prometheus text exposition format."""
+        with self._lock:
+            lines = []
+            for unit in BUCKETS:
+                metric = f"portfolio_call_{unit}"
+                lines.append(f"# HELP {metric} {HELP[unit]}")
+                lines.append(f"# TYPE {metric} histogram")
+                for (kind, name), h in sorted(self._histograms.items()):
+                    if kind != unit:
+                        continue
+                    for bound, n in h.cumulative():
+                        lines.append(f'{metric}_bucket{{fn="{name}",le="{_bound(bound)}"}} {n}')
+                    lines.append(f'{metric}_sum{{fn="{name}"}} {h.sum:.6f}')
+                    lines.append(f'{metric}_count{{fn="{name}"}} {h.count}')
+            for metric in sorted({metric for metric, _ in self._counters}):
+                lines.append(f"# HELP {metric} {COUNTERS.get(metric, metric)}")
+                lines.append(f"# TYPE {metric} counter")
+                for (kind, labels), n in sorted(self._counters.items()):
+                    if kind == metric:
+                        label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                        lines.append(f"{metric}{{{label_text}}} {n}")
+            return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+def _bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+registry = Registry()
+
+
+def _script_context():
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def instrument(fn):
+    """Record time, elements and bytes of every call to fn (no-op when disabled)."""
+    if not ENABLED:
+        return fn
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        emitted = [0, 0]
+        ctx = _script_context()
+        original = ctx._enqueue if ctx is not None else None
+        if ctx is not None:
+            # Calls nest (draw_gallery inside draw_detail_view), so every level
+            # counts what passes through it and hands on to the one below
+            def counting(msg):
+                if msg.WhichOneof("type") == "delta":
+                    emitted[0] += 1
+                    emitted[1] += msg.ByteSize()
+                original(msg)
+            ctx._enqueue = counting
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            if ctx is not None:
+                ctx._enqueue = original
+            registry.observe(name, seconds, *emitted)
+            if LOG_CALLS:
+                logger.info(json.dumps({"fn": name, "ms": round(seconds * 1000, 3),
+                                        "elements": emitted[0], "bytes": emitted[1]}))
+
+    return wrapper
+
+
+class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, kind = registry.prometheus().encode(), "text/plain; version=0.0.4"
+        elif self.path == "/metrics.json":
+            body, kind = json.dumps(registry.snapshot()).encode(), "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", kind)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_lock = threading.Lock()
+
+
+def start(port, host="0.0.0.0"):
+    """Start the metrics endpoint on a daemon thread once per process."""
+    global _server
+    with _lock:
+        if _server is None:
+            _server = http.server.ThreadingHTTPServer((host, port), MetricsRequestHandler)
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _server
@@ -0,0 +1,390 @@
+"""
+Durable queue and background delivery for contact-form submissions.
+
+submit() validates a submission and inserts it into a local SQLite queue,
+which takes a millisecond or two regardless of the mail backend, so the
+rerun that handles the form never waits on SMTP. A daemon thread per
+process claims due messages in batches, sends each batch over one SMTP
+connection and retries failures with exponential backoff.
+
+A claim pushes the message's next_attempt past a lease and tags the rows
+with a claim token instead of locking them, so several server processes
+can share the queue file, and a process that dies mid-send only delays its
+batch until the lease runs out. The lease covers the batch's worst case
+(every SMTP step timing out), the sender stops before a message that
+could outlast it, and a result is only recorded by the token's holder, so
+an expired lease can't lead to a message being sent twice.
+
+Configured with environment variables; without PORTFOLIO_SMTP_HOST the
+form stays disabled:
+
+    PORTFOLIO_SMTP_HOST, PORTFOLIO_SMTP_PORT (25)
+    PORTFOLIO_SMTP_USER, PORTFOLIO_SMTP_PASSWORD, PORTFOLIO_SMTP_STARTTLS=1
+    PORTFOLIO_CONTACT_TO (the profile's email), PORTFOLIO_CONTACT_FROM
+    PORTFOLIO_OUTBOX_PATH (outbox.sqlite3 next to the app)
+"""
+import logging
+import os
+import random
+import re
+import smtplib
+import sqlite3
+import threading
+import time
+import uuid
+from email.message import EmailMessage
+
+
+def _port_from_env():
+    try:
+        return int(os.environ.get("PORTFOLIO_SMTP_PORT", "25"))
+    except ValueError:
+        return 25
+
+
+SMTP_HOST = os.environ.get("PORTFOLIO_SMTP_HOST")
+SMTP_PORT = _port_from_env()
+SMTP_USER = os.environ.get("PORTFOLIO_SMTP_USER")
+SMTP_PASSWORD = os.environ.get("PORTFOLIO_SMTP_PASSWORD")
+SMTP_STARTTLS = os.environ.get("PORTFOLIO_SMTP_STARTTLS") == "1"
+CONTACT_TO = os.environ.get("PORTFOLIO_CONTACT_TO")
+CONTACT_FROM = os.environ.get("PORTFOLIO_CONTACT_FROM", "portfolio@localhost")
+ENABLED = SMTP_HOST is not None
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.environ.get("PORTFOLIO_OUTBOX_PATH", os.path.join(APP_DIR, "outbox.sqlite3"))
+
+BATCH_SIZE = 10
+MAX_ATTEMPTS = 8
+BACKOFF_SECONDS = 5        # doubled per failed attempt, with jitter
+MAX_BACKOFF_SECONDS = 3600
+SMTP_TIMEOUT = 30          # per socket operation
+SESSION_OPS = 4            # connect, EHLO, STARTTLS, AUTH
+MESSAGE_OPS = 5            # MAIL, RCPT, DATA, body, end of data
+# A claimed batch is retried after this if never settled: its worst case
+# with every operation timing out, so a live sender never outruns it
+LEASE_SECONDS = SMTP_TIMEOUT * (SESSION_OPS + MESSAGE_OPS * BATCH_SIZE)
+IDLE_POLL_SECONDS = 60     # picks up rows queued by other processes
+
+MAX_NAME = 100
+MAX_MESSAGE = 5000
+MIN_MESSAGE = 10
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+logger = logging.getLogger("portfolio.outbox")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    body TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',   -- pending, sent, failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    last_error TEXT,
+    sent REAL,
+    claim TEXT                                -- token of the current lease holder
+);
+CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt);
+"""
+
+
+class SubmissionError(ValueError):
+    """A contact-form submission failed validation; the message is user-facing."""
+
+
+class LeaseExpired(Exception):
+    """A claimed message wasn't sent because the lease could run out first."""
+
+
+def validate(name, email, message):
+    """Stripped (name, email, message), or SubmissionError."""
+    name, email, message = name.strip(), email.strip(), message.strip()
+    if not name or not email or not message:
+        raise SubmissionError("Please fill in your name, email and project details.")
+    if len(name) > MAX_NAME or "\n" in name or "\r" in name:
+        raise SubmissionError("Please enter a shorter name.")
+    if not EMAIL_PATTERN.match(email) or len(email) > 254:
+        raise SubmissionError("Please enter a valid email address.")
+    if len(message) < MIN_MESSAGE:
+        raise SubmissionError("Please tell me a little more about your project.")
+    if len(message) > MAX_MESSAGE:
+        raise SubmissionError(f"Please keep the details under {MAX_MESSAGE} characters.")
+    return name, email, message
+
+
+class Outbox:
+    """The SQLite queue. Every call opens its own connection, so any thread may use it."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(SCHEMA)
+                    columns = {row[1] for row in conn.execute("PRAGMA table_info(messages)")}
+                    if "claim" not in columns:  # queue files from before claim tokens
+                        conn.execute("ALTER TABLE messages ADD COLUMN claim TEXT")
+                    self._ready = True
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def enqueue(self, name, email, body):
+        now = time.time()
+        conn = self.connect()
+        try:
+            cursor = conn.execute(
+                "INSERT INTO messages (created, name, email, body, next_attempt) VALUES (?, ?, ?, ?, ?)",
+                (now, name, email, body, now),
+            )
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def claim(self, limit=BATCH_SIZE):
+        """
+        (token, due messages as (id, name, email, body, attempts)), leased to
+        the caller for LEASE_SECONDS. Settle them with the token.
+        """
+        now = time.time()
+        token = uuid.uuid4().hex
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT id, name, email, body, attempts FROM messages "
+                "WHERE status = 'pending' AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE messages SET attempts = attempts + 1, next_attempt = ?, claim = ? WHERE id = ?",
+                [(now + LEASE_SECONDS, token, row[0]) for row in rows],
+            )
+            conn.execute("COMMIT")
+            return token, [(id_, name, email, body, attempts + 1) for id_, name, email, body, attempts in rows]
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    # Every settle matches the claim token, so a worker whose lease ran out
+    # (and was taken over) can't overwrite the new holder's result
+
+    def mark_sent(self, message_id, token):
+        """Record a delivery. False if token no longer holds the message."""
+        return self._settle("status = 'sent', sent = ?, last_error = NULL", (time.time(),), message_id, token)
+
+    def mark_failed(self, message_id, token, attempts, error):
+        """
+        Schedule a retry with backoff, or give up after MAX_ATTEMPTS.
+        Returns the delay, None if given up, or False if token lost the lease.
+        """
+        if attempts >= MAX_ATTEMPTS:
+            held = self._settle("status = 'failed', last_error = ?", (error,), message_id, token)
+            return None if held else False
+        delay = min(MAX_BACKOFF_SECONDS, BACKOFF_SECONDS * 2 ** (attempts - 1))
+        delay *= random.uniform(0.8, 1.2)  # spread retries of one failed batch
+        held = self._settle("next_attempt = ?, last_error = ?", (time.time() + delay, error), message_id, token)
+        return delay if held else False
+
+    def release(self, message_id, token):
+        """Hand back a claimed message that wasn't attempted, due now and without using an attempt."""
+        return self._settle("next_attempt = ?, attempts = attempts - 1", (time.time(),), message_id, token)
+
+    def _settle(self, assignments, params, message_id, token):
+        conn = self.connect()
+        try:
+            cursor = conn.execute(
+                f"UPDATE messages SET {assignments}, claim = NULL "
+                "WHERE id = ? AND claim = ? AND status = 'pending'",
+                (*params, message_id, token),
+            )
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def next_due(self):
+        """Seconds until the earliest pending message is due, or None."""
+        conn = self.connect()
+        try:
+            (due,) = conn.execute("SELECT MIN(next_attempt) FROM messages WHERE status = 'pending'").fetchone()
+        finally:
+            conn.close()
+        return None if due is None else max(0.0, due - time.time())
+
+    def stats(self):
+        conn = self.connect()
+        try:
+            return dict(conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status").fetchall())
+        finally:
+            conn.close()
+
+
+def build_email(name, email, body, to_addr=None):
+    msg = EmailMessage()
+    msg["Subject"] = f"Portfolio contact from {name}"
+    msg["From"] = CONTACT_FROM
+    msg["To"] = to_addr or CONTACT_TO
+    msg["Reply-To"] = email
+    msg.set_content(f"{name} <{email}> wrote:\n\n{body}\n")
+    return msg
+
+
+class SmtpTransport:
+    """Sends a batch over one SMTP connection."""
+
+    def __init__(self, host=None, port=None, user=None, password=None, starttls=None):
+        self.host = host or SMTP_HOST
+        self.port = port or SMTP_PORT
+        self.user = SMTP_USER if user is None else user
+        self.password = SMTP_PASSWORD if password is None else password
+        self.starttls = SMTP_STARTTLS if starttls is None else starttls
+
+    def send_batch(self, messages, deadline=None):
+        """
+        Send each EmailMessage; returns one exception (or None) per message.
+        Messages that could still be in flight at deadline (time.monotonic())
+        aren't attempted and get LeaseExpired. Only connect, STARTTLS and
+        AUTH errors raise, since no message has been sent by then.
+        """
+        smtp = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.user:
+                smtp.login(self.user, self.password or "")
+        except BaseException:
+            smtp.close()
+            raise
+        results = []
+        try:
+            for msg in messages:
+                if deadline is not None and time.monotonic() + MESSAGE_OPS * SMTP_TIMEOUT > deadline:
+                    results.extend([LeaseExpired()] * (len(messages) - len(results)))
+                    break
+                try:
+                    smtp.send_message(msg)
+                    results.append(None)
+                except OSError as e:  # includes SMTPException
+                    # A lost connection or socket error ends the batch; the rest are retried
+                    results.append(e)
+                    if not isinstance(e, smtplib.SMTPException) or isinstance(e, smtplib.SMTPServerDisconnected):
+                        results.extend([e] * (len(messages) - len(results)))
+                        break
+        finally:
+            # Accepted messages stay sent whatever the server answers to QUIT
+            try:
+                smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                pass
+            smtp.close()
+        return results
+
+
+class DeliveryWorker:
+    """Drains an Outbox on a daemon thread; wake() after enqueueing skips the poll wait."""
+
+    def __init__(self, outbox, transport, to_addr=None):
+        self.outbox = outbox
+        self.transport = transport
+        self.to_addr = to_addr
+        self.delivered = 0
+        self.failures = 0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, name="outbox-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def run(self):
+        while not self._stop.is_set():
+            try:
+                while self.deliver_batch():
+                    if self._stop.is_set():
+                        return
+                due = self.outbox.next_due()
+            except Exception:
+                logger.exception("outbox worker error")
+                due = BACKOFF_SECONDS
+            wait = IDLE_POLL_SECONDS if due is None else min(due, IDLE_POLL_SECONDS)
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def deliver_batch(self):
+        """Claim and send one batch. Returns the number of messages claimed."""
+        deadline = time.monotonic() + LEASE_SECONDS
+        token, batch = self.outbox.claim()
+        if not batch:
+            return 0
+        emails = [build_email(name, email, body, self.to_addr) for _, name, email, body, _ in batch]
+        try:
+            results = self.transport.send_batch(emails, deadline)
+        except (OSError, smtplib.SMTPException) as e:
+            # Raised before anything was sent (connect, STARTTLS, AUTH)
+            results = [e] * len(batch)
+        for (message_id, _, _, _, attempts), error in zip(batch, results):
+            if isinstance(error, LeaseExpired):
+                self.outbox.release(message_id, token)
+                continue
+            if error is None:
+                if self.outbox.mark_sent(message_id, token):
+                    self.delivered += 1
+                else:
+                    logger.warning("contact message %s was sent after its lease passed to another worker",
+                                   message_id)
+                continue
+            self.failures += 1
+            delay = self.outbox.mark_failed(message_id, token, attempts, repr(error))
+            if delay is False:
+                logger.warning("contact message %s failed after its lease passed to another worker", message_id)
+            elif delay is None:
+                logger.error("contact message %s undeliverable after %d attempts: %r", message_id, attempts, error)
+            else:
+                logger.warning("contact message %s attempt %d failed (%r); retry in %.1fs",
+                               message_id, attempts, error, delay)
+        return len(batch)
+
+
+outbox = Outbox()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def start(to_addr=None):
+    """Start this process's delivery worker once; it also drains rows left by earlier runs."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = DeliveryWorker(outbox, SmtpTransport(), to_addr).start()
+    return _worker
+
+
+def submit(name, email, message):
+    """Validate and queue a submission for delivery. Returns its queue id."""
+    name, email, message = validate(name, email, message)
+    message_id = outbox.enqueue(name, email, message)
+    start().wake()
+    return message_id
@@ -0,0 +1,164 @@
+"""
+Precompressed siblings for the portfolio's text assets.
+
+For every CSS, JS, HTML, SVG and JSON file under the given directories,
+writes <file>.gz (gzip -9) and, when the brotli package is installed,
+<file>.br (quality 11) next to it. Compressing once at build time lets the
+server send the smaller file with no per-request CPU, at ratios too slow
+to use on the fly. asset_server.py picks a sibling with negotiate(); nginx
+(gzip_static / brotli_static) and most CDNs understand the same layout.
+
+Siblings are only rewritten when the source is newer, and skipped when
+they wouldn't be smaller. assets.write_static() and export_site.py call
+this for the files they write; the CLI covers everything else:
+
+    python precompress.py [static/assets site ...] [--force]
+"""
+import argparse
+import gzip
+import os
+import threading
+import time
+
+try:
+    import brotli
+except ImportError:  # optional: gzip siblings only
+    brotli = None
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIRS = (os.path.join(APP_DIR, "static", "assets"), os.path.join(APP_DIR, "site"))
+
+TEXT_EXTENSIONS = (".css", ".js", ".mjs", ".html", ".svg", ".json", ".txt", ".xml")
+MIN_BYTES = 256  # below this the saving doesn't cover a compressed response's overhead
+
+# Content-Encoding -> sibling suffix, in order of preference
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def encodings():
+    """Encodings this process can write."""
+    return [e for e in SUFFIXES if e != "br" or brotli is not None]
+
+
+def compress(data, encoding):
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def sibling(path, encoding):
+    return path + SUFFIXES[encoding]
+
+
+def is_text(path):
+    return path.lower().endswith(TEXT_EXTENSIONS)
+
+
+def _write(target, data):
+    tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as file:
+        file.write(data)
+    os.replace(tmp, target)
+
+
+def precompress_file(path, force=False):
+    """
+    Write the missing or stale siblings of one file.
+    Returns {encoding: compressed size} for the siblings written.
+    """
+    written = {}
+    if not is_text(path):
+        return written
+    source = os.stat(path)
+    data = None
+    for encoding in encodings():
+        target = sibling(path, encoding)
+        try:
+            if not force and os.stat(target).st_mtime_ns >= source.st_mtime_ns:
+                continue
+        except OSError:
+            pass
+        if data is None:
+            with open(path, "rb") as file:
+                data = file.read()
+        packed = compress(data, encoding) if len(data) >= MIN_BYTES else data
+        if len(packed) >= len(data):
+            # Not worth sending; drop a stale sibling so it can't be served
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+        _write(target, packed)
+        written[encoding] = len(packed)
+    return written
+
+
+def precompress_tree(root, force=False):
+    """precompress_file() for every text file under root. Returns totals."""
+    totals = {"files": 0, "bytes": 0, **{encoding: 0 for encoding in encodings()}}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            if not is_text(path):
+                continue
+            written = precompress_file(path, force)
+            totals["files"] += 1
+            totals["bytes"] += os.path.getsize(path)
+            for encoding in totals.keys() & SUFFIXES.keys():
+                target = sibling(path, encoding)
+                totals[encoding] += written.get(encoding) or (os.path.getsize(target) if os.path.exists(target)
+                                                              else os.path.getsize(path))
+    return totals
+
+
+def accepted(header):
+    """{coding: q} from an Accept-Encoding header."""
+    accepted = {}
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def negotiate(path, accept_encoding):
+    """
+    (encoding, file to send) for a request: the preferred sibling that the
+    client accepts and that exists, else (None, path).
+    """
+    if not is_text(path):
+        return None, path
+    client = accepted(accept_encoding)
+    wildcard = client.get("*", 0.0)
+    for encoding in SUFFIXES:
+        if client.get(encoding, wildcard) > 0 and os.path.isfile(sibling(path, encoding)):
+            return encoding, sibling(path, encoding)
+    return None, path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write gzip/brotli siblings for text assets")
+    parser.add_argument("dirs", nargs="*", default=[d for d in DEFAULT_DIRS if os.path.isdir(d)])
+    parser.add_argument("--force", action="store_true", help="rewrite siblings even if current")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli is not installed (pip install brotli): writing gzip siblings only")
+    start = time.perf_counter()
+    for root in args.dirs:
+        totals = precompress_tree(root, args.force)
+        sizes = ", ".join(f"{e} {totals[e]:,}" for e in encodings())
+        print(f"{root}: {totals['files']} text files, {totals['bytes']:,} bytes -> {sizes}")
+    print(f"done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
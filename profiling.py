@@ -0,0 +1,98 @@
+"""
+Opt-in startup profiling for Portfolio.py.
+
+Run with PORTFOLIO_PROFILE_STARTUP=1 to log, for each script run, the wall
+time of each named section of the script, and for the process's first run
+the wall time of every module it imported for the first time. With the
+variable unset every hook is a no-op.
+"""
+import builtins
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("PORTFOLIO_PROFILE_STARTUP") == "1"
+
+logger = logging.getLogger("portfolio.startup")
+if ENABLED and not logger.handlers:
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
+
+# as_dict() of the most recent reported run, read by benchmarks/startup.py
+last_report = None
+
+# builtins.__import__ is process-wide and sessions run concurrently, so only
+# the first run patches it; later runs find every module already loaded
+_import_hook_lock = threading.Lock()
+_import_hook_used = False
+
+
+class StartupProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports = []    # (module, seconds) for modules not yet loaded
+        self.sections = []   # (name, seconds)
+
+    @contextmanager
+    def track_imports(self):
+        """Time top-level imports executed inside the block, on the process's first run."""
+        global _import_hook_used
+        if not ENABLED:
+            yield
+            return
+        with _import_hook_lock:
+            first, _import_hook_used = not _import_hook_used, True
+        if not first:
+            yield
+            return
+        original = builtins.__import__
+        depth = [0]
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if depth[0] or level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                depth[0] -= 1
+                self.imports.append((name, time.perf_counter() - start))
+
+        builtins.__import__ = timed_import
+        try:
+            yield
+        finally:
+            builtins.__import__ = original
+
+    @contextmanager
+    def section(self, name):
+        if not ENABLED:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((name, time.perf_counter() - start))
+
+    def as_dict(self):
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "imports_ms": {name: round(s * 1000, 2) for name, s in self.imports},
+            "sections_ms": {name: round(s * 1000, 2) for name, s in self.sections},
+        }
+
+    def report(self):
+        global last_report
+        if not ENABLED:
+            return
+        last_report = self.as_dict()
+        lines = [f"script run: {(time.perf_counter() - self.started) * 1000:.1f} ms"]
+        for label, rows in (("import", self.imports), ("section", self.sections)):
+            for name, seconds in sorted(rows, key=lambda row: -row[1]):
+                lines.append(f"  {label:<8} {name:<32} {seconds * 1000:8.1f} ms")
+        logger.info("\n".join(lines))
@@ -0,0 +1,131 @@
+"""
+Token-bucket rate limiting for the interactions that cost a rerun.
+
+Every guarded action ("view", "filter", "contact") spends one token from
+two buckets: one for the browser session and one, LIMITS_PER_ADDRESS times
+larger, for the client address, so a script that opens fresh sessions is
+still held to its address's budget while visitors behind one NAT share a
+generous one. Buckets refill continuously; a request is served only if both
+have a token. Callers answer rejected requests with something cheap (a
+notice, or the previous result) instead of doing the work.
+
+Streamlit reports no address for local connections, so behind a proxy on
+the same host only session buckets apply; behind one on another host every
+client shares the proxy's address, and PORTFOLIO_RATE_LIMIT_PER_ADDRESS
+should be raised, or set to 0 to drop address buckets.
+
+Served and rejected counts go to the portfolio_rate_limit_total counter in
+metrics.py. PORTFOLIO_RATE_LIMIT=0 turns limiting off.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+
+ENABLED = os.environ.get("PORTFOLIO_RATE_LIMIT", "1") != "0"
+
+# action -> (burst capacity, tokens refilled per second) for one session
+LIMITS = {
+    "view": (10, 0.5),        # project detail pages opened
+    "filter": (20, 1.0),      # search/category/facet changes
+    "contact": (3, 1 / 60),   # contact-form submissions
+}
+
+
+def _per_address_from_env():
+    try:
+        return max(0.0, float(os.environ.get("PORTFOLIO_RATE_LIMIT_PER_ADDRESS", "5")))
+    except ValueError:
+        return 5.0
+
+
+# An address gets this many sessions' worth; 0 disables address buckets
+LIMITS_PER_ADDRESS = _per_address_from_env()
+MAX_BUCKETS = 10000           # least recently used buckets are dropped beyond this
+
+
+class TokenBucket:
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def retry_after(self):
+        """Seconds until the next token, 0 if one is available."""
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Buckets keyed on (action, scope, key), bounded LRU, thread-safe."""
+
+    def __init__(self, limits=LIMITS, per_address=LIMITS_PER_ADDRESS, max_buckets=MAX_BUCKETS):
+        self.limits = limits
+        self.per_address = per_address
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bucket(self, action, scope, key, now):
+        bucket_key = (action, scope, key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            capacity, rate = self.limits[action]
+            factor = self.per_address if scope == "address" else 1
+            bucket = self._buckets[bucket_key] = TokenBucket(capacity * factor, rate * factor)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(bucket_key)
+        bucket.refill(now)
+        return bucket
+
+    def check(self, action, session_id=None, address=None):
+        """
+        Spend a token for action if the session and address both have one.
+        Returns 0.0 when served, else the seconds until a retry would be.
+        """
+        now = time.monotonic()
+        with self._lock:
+            keys = [("session", session_id)]
+            if self.per_address:
+                keys.append(("address", address))
+            buckets = [self._bucket(action, scope, key, now) for scope, key in keys if key]
+            wait = max((b.retry_after() for b in buckets), default=0.0)
+            if not wait:
+                for bucket in buckets:
+                    bucket.tokens -= 1
+        metrics.registry.increment("portfolio_rate_limit_total", action=action,
+                                   outcome="rejected" if wait else "served")
+        return wait
+
+
+limiter = RateLimiter()
+
+
+def client_keys():
+    """(session id, client address) of the current script run; either may be None."""
+    try:
+        import streamlit as st
+        from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+    except ImportError:
+        return None, None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    try:
+        address = st.context.ip_address
+    except Exception:
+        address = None
+    return (ctx.session_id if ctx else None), address
+
+
+def check(action):
+    """limiter.check() for the current session and client; always 0.0 when disabled."""
+    if not ENABLED:
+        return 0.0
+    return limiter.check(action, *client_keys())
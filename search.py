@@ -0,0 +1,220 @@
+"""
+In-memory full-text and faceted search over the project catalog.
+
+An inverted index maps each token of title, desc, stack, client and type to
+the projects containing it, weighted by field. Query terms match exactly,
+by prefix (via a sorted vocabulary) or, for terms of 4+ characters, within
+one edit (via a delete-neighbourhood index), so lookups never scan the
+catalog. sync() re-indexes only projects whose searchable fields changed.
+"""
+import bisect
+import hashlib
+import json
+import re
+import threading
+from collections import defaultdict
+
+FIELD_WEIGHTS = {"title": 3.0, "stack": 2.0, "type": 2.0, "client": 1.5, "desc": 1.0}
+FACETS = ("stack", "client")
+
+EXACT, PREFIX, FUZZY = 1.0, 0.7, 0.5
+FUZZY_MIN_LENGTH = 4
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+
+def tokenize(text):
+    return [t.rstrip(".") for t in TOKEN.findall(text.lower())]
+
+
+def _deletes(word):
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insert, delete, substitution or swap."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        diff = [i for i in range(len(a)) if a[i] != b[i]]
+        return len(diff) == 1 or (
+            len(diff) == 2 and diff[1] == diff[0] + 1
+            and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+        )
+    short, long = (a, b) if len(a) < len(b) else (b, a)
+    return any(long[:i] + long[i + 1:] == short for i in range(len(long)))
+
+
+def _fingerprint(project):
+    fields = {key: project.get(key) for key in FIELD_WEIGHTS}
+    return hashlib.sha1(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+def _facet_values(project, facet):
+    value = project.get(facet)
+    return value if isinstance(value, list) else [value]
+
+
+class SearchIndex:
+    def __init__(self, projects=()):
+        self.postings = defaultdict(dict)   # token -> {project id: weight}
+        self.vocab = []                     # sorted tokens, for prefix ranges
+        self.neighbours = defaultdict(set)  # token or one-delete variant -> tokens
+        self.docs = {}                      # project id -> (fingerprint, tokens, facets)
+        self.facet_postings = {facet: defaultdict(set) for facet in FACETS}  # value -> ids
+        self.order = {}                     # project id -> catalog position
+        self._lock = threading.RLock()
+        self.sync(projects)
+
+    # -- maintenance --
+
+    def _add(self, project):
+        weights = defaultdict(float)
+        for field, weight in FIELD_WEIGHTS.items():
+            value = project.get(field) or ""
+            text = " ".join(value) if isinstance(value, list) else value
+            for token in tokenize(text):
+                weights[token] += weight
+        p_id = project["id"]
+        for token, weight in weights.items():
+            if token not in self.postings:
+                bisect.insort(self.vocab, token)
+                for key in _deletes(token) | {token}:
+                    self.neighbours[key].add(token)
+            self.postings[token][p_id] = weight
+        facets = {facet: _facet_values(project, facet) for facet in FACETS}
+        for facet, values in facets.items():
+            for value in values:
+                self.facet_postings[facet][value].add(p_id)
+        self.docs[p_id] = (_fingerprint(project), set(weights), facets)
+
+    def _remove(self, p_id):
+        _, tokens, facets = self.docs.pop(p_id)
+        for facet, values in facets.items():
+            for value in values:
+                ids = self.facet_postings[facet][value]
+                ids.discard(p_id)
+                if not ids:
+                    del self.facet_postings[facet][value]
+        for token in tokens:
+            postings = self.postings[token]
+            postings.pop(p_id, None)
+            if not postings:
+                del self.postings[token]
+                del self.vocab[bisect.bisect_left(self.vocab, token)]
+                for key in _deletes(token) | {token}:
+                    self.neighbours[key].discard(token)
+                    if not self.neighbours[key]:
+                        del self.neighbours[key]
+
+    def sync(self, projects):
+        """Bring the index in line with projects, touching only changed records.
+        Returns the number of projects (re)indexed or removed."""
+        with self._lock:
+            changed = 0
+            current = {}
+            for position, project in enumerate(projects):
+                current[project["id"]] = project
+                self.order[project["id"]] = position
+            for p_id in list(self.docs):
+                if p_id not in current:
+                    self._remove(p_id)
+                    self.order.pop(p_id, None)
+                    changed += 1
+            for p_id, project in current.items():
+                doc = self.docs.get(p_id)
+                if doc is not None and doc[0] == _fingerprint(project):
+                    continue
+                if doc is not None:
+                    self._remove(p_id)
+                self._add(project)
+                changed += 1
+            return changed
+
+    # -- querying --
+
+    def _expand(self, term):
+        """{token: match quality} for one query term."""
+        matches = {}
+        if term in self.postings:
+            matches[term] = EXACT
+        start = bisect.bisect_left(self.vocab, term)
+        for token in self.vocab[start:bisect.bisect_right(self.vocab, term + "\uffff")]:
+            matches.setdefault(token, PREFIX)
+        if len(term) >= FUZZY_MIN_LENGTH:
+            candidates = set(self.neighbours.get(term, ()))
+            for key in _deletes(term):
+                candidates |= self.neighbours.get(key, set())
+            for token in candidates:
+                if token not in matches and _within_one_edit(term, token):
+                    matches[token] = FUZZY
+        return matches
+
+    def search(self, query="", filters=None, limit=None):
+        """
+        Match every query term (AND), then apply facet filters (OR within a
+        facet, AND across facets). Returns (ids ranked by score, facet counts).
+        Counts for a facet ignore that facet's own filter, so options stay
+        selectable. An empty query matches every project in catalog order.
+        """
+        filters = {facet: set(values) for facet, values in (filters or {}).items() if values}
+        with self._lock:
+            terms = tokenize(query)
+            if terms:
+                scores = None
+                for term in terms:
+                    term_scores = defaultdict(float)
+                    for token, quality in self._expand(term).items():
+                        for p_id, weight in self.postings[token].items():
+                            term_scores[p_id] = max(term_scores[p_id], weight * quality)
+                    if scores is None:
+                        scores = dict(term_scores)
+                    else:
+                        scores = {p_id: s + term_scores[p_id] for p_id, s in scores.items() if p_id in term_scores}
+                    if not scores:
+                        break
+            else:
+                scores = dict.fromkeys(self.docs, 0.0)
+
+            # Ids allowed by each active facet filter
+            allowed = {
+                facet: set().union(*(self.facet_postings[facet].get(v, ()) for v in wanted))
+                for facet, wanted in filters.items()
+            }
+            matched = set(scores)
+
+            counts = {}
+            for facet in FACETS:
+                base = matched.intersection(*(ids for f, ids in allowed.items() if f != facet))
+                facet_counts = counts[facet] = defaultdict(int)
+                for p_id in base:
+                    for value in self.docs[p_id][2][facet]:
+                        facet_counts[value] += 1
+
+            hits = list(matched.intersection(*allowed.values()))
+            hits.sort(key=lambda p_id: (-scores[p_id], self.order[p_id]))
+            if limit is not None:
+                hits = hits[:limit]
+            return hits, {facet: dict(values) for facet, values in counts.items()}
+
+
+_index = None
+_indexed_list = None
+_index_lock = threading.Lock()
+
+
+def get_index(projects):
+    """
+    Process-wide index, incrementally synced whenever a new project list is
+    passed in (load_content() returns the same list until a file changes).
+    """
+    global _index, _indexed_list
+    with _index_lock:
+        if _index is None:
+            _index = SearchIndex(projects)
+        elif projects is not _indexed_list:
+            _index.sync(projects)
+        _indexed_list = projects
+        return _index
@@ -0,0 +1,373 @@
+"""
+Precompiled, auto-escaping HTML templates for Portfolio.py.
+
+Templates use str.format field syntax ({title}, {count:d}) and are parsed
+once at import, which Streamlit does once per process. Every field is
+HTML-escaped unless its value is Markup, so content from content/*.json
+can't inject markup. Project fragments (cards, detail header, stack list)
+are memoized on a hash of the project record: an unchanged project is
+rendered once per process, and editing it changes the key.
+"""
+import hashlib
+import html
+import json
+import string
+import textwrap
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+MAX_FRAGMENTS = 1024
+
+
+class Markup(str):
+    """HTML that is already safe; inserted into templates as is."""
+
+
+def escape(value):
+    if isinstance(value, Markup):
+        return value
+    return Markup(html.escape(str(value), quote=True))
+
+
+class Template:
+    """
+    A template compiled to literal/field segments. The source is dedented
+    and blank lines are dropped, so output can go straight into a markdown
+    element without ending its HTML block.
+    """
+
+    def __init__(self, source):
+        source = "\n".join(line for line in textwrap.dedent(source).strip().splitlines() if line.strip())
+        self.segments = []
+        self.fields = set()
+        for literal, name, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                self.segments.append((literal, None, None))
+            if name is not None:
+                if not name.isidentifier() or conversion:
+                    raise ValueError(f"unsupported template field {{{name}}}")
+                self.segments.append((None, name, spec))
+                self.fields.add(name)
+
+    def render(self, **fields):
+        missing = self.fields - set(fields)
+        if missing:
+            raise KeyError(f"template fields not given: {', '.join(sorted(missing))}")
+        out = []
+        for literal, name, spec in self.segments:
+            if name is None:
+                out.append(literal)
+            else:
+                value = fields[name]
+                out.append(escape(format(value, spec) if spec else value))
+        return Markup("".join(out))
+
+
+BADGE = Template("""
+<span style="background: rgba(102, 252, 241, 0.1); color: #66fcf1; padding: 2px 8px; border-radius: 10px; font-size: 0.7rem; font-weight: 500;">{tech}</span>
+""")
+
+CARD = Template("""
+<div class="project-card magnetic-element" onclick="this.style.transform='scale(0.98)'; setTimeout(() => this.style.transform='', 150)">
+    <div style="display:flex; justify-content:space-between; align-items:flex-start; margin-bottom: 16px;">
+        <span class="metric-pill">{metric}</span>
+        <div style="text-align: right;">
+            <span style="font-size:0.75rem; opacity:0.7; display: block;">{type}</span>
+            <span style="font-size:0.7rem; opacity:0.5; display: block;">{client}</span>
+        </div>
+    </div>
+    <h3 style="margin: 0 0 12px 0; font-size: 1.3rem; line-height: 1.3; color: var(--text-highlight);">{title}</h3>
+    <p style="font-size:0.9rem; color:#a0a0a0; margin: 0 0 16px 0; line-height: 1.5;">{summary}...</p>
+    <div style="display: flex; flex-wrap: wrap; gap: 6px; margin-bottom: 16px;">
+        {badges}
+    </div>
+    <!-- Subtle shine effect -->
+    <div style="position: absolute; bottom: 0; left: 0; right: 0; height: 1px; background: linear-gradient(90deg, transparent 0%, var(--accent) 50%, transparent 100%); opacity: 0.3;"></div>
+</div>
+""")
+
+CARD_GITHUB = Template("""
+<a href="{url}" target="_blank" style="text-decoration: none;">
+    <button style="width: 100%; background: rgba(102, 252, 241, 0.1); border: 1px solid rgba(102, 252, 241, 0.3); color: #66fcf1; padding: 6px 12px; border-radius: 6px; font-size: 0.8rem; font-weight: 600; cursor: pointer; transition: all 0.3s ease;" onmouseover="this.style.background='rgba(102, 252, 241, 0.2)'; this.style.borderColor='#66fcf1';" onmouseout="this.style.background='rgba(102, 252, 241, 0.1)'; this.style.borderColor='rgba(102, 252, 241, 0.3)';">Code ↗</button>
+</a>
+""")
+
+DETAIL_GITHUB = Template("""
+<a href="{url}" target="_blank"><button style="background:rgba(102, 252, 241, 0.1); color:#66fcf1; border:1px solid #66fcf1; border-radius:6px; font-weight:600; padding:6px 12px; cursor:pointer; width:100%;">View Code ↗</button></a>
+""")
+
+DETAIL_TITLE = Template("""
+<h1 style="font-size:3.5rem;">{title}</h1>
+<span style="color:#66fcf1; font-size:1.2rem; font-family:Space Grotesk;">{client}</span>
+""")
+
+DETAIL_METRIC = Template("""
+<div style="text-align:right; border-left:2px solid #66fcf1; padding-left:20px;">
+    <div style="font-size:2.5rem; font-weight:bold; color:#fff;">{value}</div>
+    <div style="color:#aaa;">{label}</div>
+</div>
+""")
+
+TOOL = Template("""
+<div style="background:rgba(255,255,255,0.05); padding:10px; margin-bottom:8px; border-radius:5px; border-left:3px solid #66fcf1;">
+    {tool}
+</div>
+""")
+
+GALLERY_IMAGE = Template("""
+<div style="border-radius:12px; overflow:hidden; border:1px solid rgba(102, 252, 241, 0.2); margin-bottom:8px;">
+    {image}
+</div>
+""")
+
+FULL_IMAGE = Template("""
+<img src="{src}" style="width:100%; height:auto; display:block;">
+""")
+
+SECTION_HEADER = Template("{spacer}<h3>{title}</h3><hr>")
+
+HERO_INTRO = Template("""
+<div class="hero-container">
+    <div style="text-align:center;">{mobile_image}</div>
+    <div class="big-title">{name}</div>
+    <div class="subtitle">{title}</div>
+    <div style="font-size: 1.1rem; line-height: 1.6; color: var(--text); margin-bottom: 2rem;">
+        {about}
+    </div>
+    <h3>Core Competencies</h3>
+    {skills}
+</div>
+""")
+
+# The shared progressAnimation keyframe in theme.py reads each bar's --target
+SKILL = Template("""
+<div style="margin-bottom: 16px;">
+    <div style="display: flex; justify-content: space-between; margin-bottom: 4px;">
+        <span style="font-weight: 600; color: var(--text);">{skill}</span>
+        <span style="color: var(--accent); font-weight: 600;">{level:d}%</span>
+    </div>
+    <div class="skill-bar">
+        <div class="skill-fill" style="--target: {level:d}%;"></div>
+    </div>
+</div>
+""")
+
+SOCIAL_LINK = Template("""
+<a href="{url}" style="color:#66fcf1; text-decoration:none; font-weight:600; transition: all 0.3s ease;" onmouseover="this.style.color='#45a29e'; this.style.transform='scale(1.1)';" onmouseout="this.style.color='#66fcf1'; this.style.transform='scale(1)';">{platform} ↗</a>
+""")
+
+DOWNLOAD_LINK = Template("""
+<a class="download-link" href="{url}" download="{file_name}">{label}</a>
+""")
+
+# A CSS grid instead of st.columns keeps the whole timeline one element
+TIMELINE_ROW = Template("""
+<div style="display:grid; grid-template-columns:1fr 4fr; gap:1rem; margin-bottom:1.5rem;">
+    <div style="color:#66fcf1; font-weight:bold; margin-top:5px;">{year}</div>
+    <div>
+        <div style="font-size:1.1rem; font-weight:bold; color:#fff;">{role}</div>
+        <div style="font-size:0.9rem; color:#aaa; margin-bottom:5px;">{company}</div>
+        <div style="font-size:0.9rem; color:#c5c6c7; font-style:italic;">{impact}</div>
+    </div>
+</div>
+""")
+
+TESTIMONIAL = Template("""
+<div class="testimonial-card">
+    <div style="font-size:1.1rem; color:#fff; font-style:italic;">"{quote}"</div>
+    <div style="margin-top:10px; color:#66fcf1; font-weight:bold;">— {author}</div>
+</div>
+""")
+
+TESTIMONIALS = Template("""
+<div style="display:grid; grid-template-columns:repeat(auto-fit, minmax(280px, 1fr)); gap:1rem;">
+    {cards}
+</div>
+""")
+
+EMAIL_BOX = Template("""
+<div style="background:rgba(31,40,51,0.5); padding:30px; border-radius:12px; text-align:center;">
+    <h4>Prefer Email?</h4>
+    <p>I typically respond within 24 hours.</p>
+    <br>
+    <a href="{url}" style="background:#66fcf1; color:#0b0c10; padding:12px 24px; border-radius:6px; text-decoration:none; font-weight:bold;">Send Email ✉</a>
+</div>
+""")
+
+FOOTER = Template("""
+<br><hr>
+<div style="text-align: center; padding: 2rem 0; position: relative;">
+    <div style="margin-bottom: 1rem;">
+        <span style="color: var(--accent); font-size: 1.2rem; font-weight: 600;">🚀</span>
+        <span style="color: var(--text); font-size: 0.9rem; margin-left: 8px;">Built with Streamlit &amp; Advanced CSS</span>
+    </div>
+    <div style="color: var(--text-muted); font-size: 0.8rem; line-height: 1.6;">
+        <p>Transforming complex data challenges into elegant, scalable solutions.</p>
+        <p style="margin-top: 8px;">
+            <span style="color: var(--accent);">✨</span> Last updated: January 2026
+            <span style="margin: 0 12px;">•</span>
+            <span style="color: var(--accent);">🎯</span> Open to new opportunities
+        </p>
+    </div>
+    <div style="margin-top: 1rem;">
+        <button onclick="document.body.scrollTop = 0; document.documentElement.scrollTop = 0;"
+                style="background: rgba(102, 252, 241, 0.1); border: 1px solid rgba(102, 252, 241, 0.3); color: var(--accent); padding: 8px 16px; border-radius: 20px; font-size: 0.8rem; cursor: pointer; transition: all 0.3s ease;"
+                onmouseover="this.style.background='rgba(102, 252, 241, 0.2)'; this.style.transform='translateY(-2px)';"
+                onmouseout="this.style.background='rgba(102, 252, 241, 0.1)'; this.style.transform='translateY(0)';">
+            ↑ Back to Top
+        </button>
+    </div>
+</div>
+""")
+
+
+def safe_url(url):
+    """url if it is http(s) or mailto, else "#"; escaping alone doesn't stop javascript: links."""
+    scheme = urlsplit(url.strip()).scheme.lower()
+    return url if scheme in ("", "http", "https", "mailto") else "#"
+
+
+def image_src(url):
+    """safe_url() that also keeps the data:image URIs inline asset mode produces."""
+    return url if url.strip().lower().startswith("data:image/") else safe_url(url)
+
+
+def has_github(proj):
+    return bool(proj.get("github")) and proj["github"] != "#"
+
+
+def _card(proj):
+    badges = Markup("".join(BADGE.render(tech=tech) for tech in proj["stack"][:3]))
+    return CARD.render(
+        metric=proj["metric"], type=proj["type"], client=proj["client"],
+        title=proj["title"], summary=proj["desc"][:120], badges=badges,
+    )
+
+
+def _detail_metric(proj):
+    value, _, label = proj["metric"].partition(" ")
+    return DETAIL_METRIC.render(value=value, label=label)
+
+
+def _stack(proj):
+    return Markup("\n".join(TOOL.render(tool=tool) for tool in proj["stack"]))
+
+
+# fragment name -> project record -> Markup
+PROJECT_FRAGMENTS = {
+    "card": _card,
+    "card_github": lambda proj: CARD_GITHUB.render(url=safe_url(proj["github"])),
+    "detail_github": lambda proj: DETAIL_GITHUB.render(url=safe_url(proj["github"])),
+    "detail_title": lambda proj: DETAIL_TITLE.render(title=proj["title"], client=proj["client"]),
+    "detail_metric": _detail_metric,
+    "stack": _stack,
+}
+
+
+def record_hash(record):
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode()).hexdigest()
+
+
+class FragmentCache:
+    """
+    LRU of rendered project fragments keyed on (fragment, record hash).
+    load_content() hands out the same dicts until a file changes, so each
+    record's hash is also remembered by identity and computed once.
+    """
+
+    def __init__(self, max_entries=MAX_FRAGMENTS):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._hashes = {}   # id(record) -> (record, hash)
+        self._lock = threading.Lock()
+
+    def _hash(self, record):
+        known = self._hashes.get(id(record))
+        if known is not None and known[0] is record:
+            return known[1]
+        digest = record_hash(record)
+        if len(self._hashes) >= self.max_entries:
+            self._hashes.clear()
+        self._hashes[id(record)] = (record, digest)
+        return digest
+
+    def get(self, name, record):
+        with self._lock:
+            key = (name, self._hash(record))
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        # Rendering is pure, so a concurrent duplicate render is harmless
+        value = PROJECT_FRAGMENTS[name](record)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hashes.clear()
+            self.hits = self.misses = 0
+
+
+fragment_cache = FragmentCache()
+
+
+def project_fragment(name, proj):
+    """Rendered fragment for a project; see PROJECT_FRAGMENTS for names."""
+    return fragment_cache.get(name, proj)
+
+
+# -- page sections (shared with export_site.py) --
+
+def full_image(src):
+    """Full-size lightbox image; src may be a URL or an inline data:image URI."""
+    return FULL_IMAGE.render(src=image_src(src))
+
+
+def section_header(title, spacer=True):
+    """Spacing, heading and rule above a page section."""
+    return SECTION_HEADER.render(title=title, spacer=Markup("<br><br>" if spacer else ""))
+
+
+def hero_intro(profile, mobile_image):
+    """Name, title, about text and skill bars; mobile_image is Markup."""
+    skills = Markup("\n".join(
+        SKILL.render(skill=skill, level=level) for skill, level in profile.get("skills", {}).items()
+    ))
+    return HERO_INTRO.render(
+        mobile_image=mobile_image, name=profile["name"], title=profile["title"],
+        about=profile["about"], skills=skills,
+    )
+
+
+def socials(links):
+    return Markup(" &nbsp; • &nbsp; ".join(
+        SOCIAL_LINK.render(platform=platform, url=safe_url(url)) for platform, url in links.items()
+    ))
+
+
+def timeline(experience):
+    return Markup("\n".join(TIMELINE_ROW.render(**role) for role in experience))
+
+
+def testimonials(items):
+    cards = Markup("\n".join(TESTIMONIAL.render(**item) for item in items))
+    return TESTIMONIALS.render(cards=cards)
+
+
+def email_box(url):
+    return EMAIL_BOX.render(url=safe_url(url))
@@ -0,0 +1,111 @@
+"""Delivery, retries, leases and claim tokens of the contact-form outbox."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pytest  # noqa: E402
+
+import outbox  # noqa: E402
+from contact import start_stand_in  # noqa: E402
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return outbox.Outbox(str(tmp_path / "outbox.sqlite3"))
+
+
+def worker_for(queue, server):
+    transport = outbox.SmtpTransport("127.0.0.1", server.server_address[1], user="", starttls=False)
+    return outbox.DeliveryWorker(queue, transport, "owner@example.com")
+
+
+def enqueue(queue, count):
+    return [queue.enqueue(f"Visitor {n}", f"visitor{n}@example.com", "A message about a project.")
+            for n in range(count)]
+
+
+def rows(queue):
+    conn = queue.connect()
+    try:
+        return conn.execute("SELECT id, status, attempts, claim FROM messages ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def test_delivered_batch_is_not_requeued_when_quit_reply_is_odd(queue):
+    server = start_stand_in(0, 0, quit_reply="250 OK")
+    try:
+        enqueue(queue, 3)
+        worker = worker_for(queue, server)
+        assert worker.deliver_batch() == 3
+    finally:
+        server.shutdown()
+    assert len(server.stand_in.received) == 3
+    assert queue.stats() == {"sent": 3}
+    assert worker.delivered == 3 and worker.failures == 0
+
+
+def test_rejected_message_is_retried_with_backoff(queue, monkeypatch):
+    monkeypatch.setattr(outbox, "BACKOFF_SECONDS", 60)
+    server = start_stand_in(0, 1)
+    try:
+        first, second = enqueue(queue, 2)
+        worker = worker_for(queue, server)
+        worker.deliver_batch()
+    finally:
+        server.shutdown()
+    assert rows(queue) == [(first, "pending", 1, None), (second, "sent", 1, None)]
+    assert 40 < queue.next_due() <= 72
+    assert worker.deliver_batch() == 0  # not due yet
+
+
+def test_message_is_given_up_after_max_attempts(queue):
+    (message_id,) = enqueue(queue, 1)
+    token, batch = queue.claim()
+    assert queue.mark_failed(message_id, token, outbox.MAX_ATTEMPTS, "boom") is None
+    assert queue.stats() == {"failed": 1}
+
+
+def test_claimed_messages_are_leased(queue):
+    enqueue(queue, 2)
+    token, batch = queue.claim()
+    assert len(batch) == 2 and all(attempts == 1 for *_, attempts in batch)
+    assert queue.claim()[1] == []  # leased, so nothing is due
+    assert queue.next_due() > outbox.LEASE_SECONDS - 5
+
+
+def test_expired_lease_passes_to_the_next_claim(queue, monkeypatch):
+    (message_id,) = enqueue(queue, 1)
+    monkeypatch.setattr(outbox, "LEASE_SECONDS", -1)
+    old_token, _ = queue.claim()
+    new_token, batch = queue.claim()
+    assert [row[0] for row in batch] == [message_id]
+    assert queue.mark_sent(message_id, old_token) is False
+    assert queue.mark_failed(message_id, old_token, 1, "late") is False
+    assert queue.mark_sent(message_id, new_token) is True
+    assert rows(queue) == [(message_id, "sent", 2, None)]
+
+
+def test_release_hands_back_the_attempt(queue):
+    (message_id,) = enqueue(queue, 1)
+    token, _ = queue.claim()
+    assert queue.release(message_id, token) is True
+    assert rows(queue) == [(message_id, "pending", 0, None)]
+    assert queue.next_due() == 0.0
+
+
+def test_messages_that_could_outlast_the_lease_are_released(queue):
+    server = start_stand_in(0, 0)
+    try:
+        enqueue(queue, 2)
+        worker = worker_for(queue, server)
+        token, batch = queue.claim()
+        emails = [outbox.build_email(name, email, body) for _, name, email, body, _ in batch]
+        results = worker.transport.send_batch(emails, deadline=0)
+    finally:
+        server.shutdown()
+    assert all(isinstance(result, outbox.LeaseExpired) for result in results)
+    assert server.stand_in.received == []
@@ -0,0 +1,100 @@
+"""Matching, facet counts and incremental sync of the project search index."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search  # noqa: E402
+
+PROJECTS = [
+    {"id": 1, "title": "Loan Approval Prediction", "desc": "Credit risk scoring with gradient boosting.",
+     "stack": ["Python", "XGBoost", "Streamlit"], "client": "FinTech", "type": "Classification"},
+    {"id": 2, "title": "Stock Forecasting", "desc": "Demand forecasting and recommendations.",
+     "stack": ["Python", "Prophet"], "client": "Retail", "type": "Time Series"},
+    {"id": 3, "title": "Fake News Detection", "desc": "Text classification of news articles.",
+     "stack": ["Python", "Scikit-Learn", "Streamlit"], "client": "Media", "type": "NLP"},
+]
+
+
+def ids(index, query="", filters=None):
+    return index.search(query, filters)[0]
+
+
+def test_exact_match_is_ranked_by_field_weight():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index, "classification") == [1, 3]  # 1 by type, 3 by description only
+    assert ids(index, "xgboost") == [1]
+
+
+def test_prefix_match():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index, "forec") == [2]
+    assert ids(index, "stream") == [1, 3]
+
+
+def test_one_edit_match_for_longer_terms_only():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index, "xgbost") == [1]       # deletion
+    assert ids(index, "prohpet") == [2]      # transposition
+    assert ids(index, "nwes") == [3]         # 4 characters: fuzzy applies
+    assert ids(index, "nlq") == []           # 3 characters: no fuzzy match
+    assert ids(index, "xgbooooost") == []    # more than one edit
+
+
+def test_exact_beats_prefix_beats_fuzzy():
+    index = search.SearchIndex([
+        {"id": 1, "title": "model"}, {"id": 2, "title": "models"}, {"id": 3, "title": "modal"},
+    ])
+    assert ids(index, "model") == [1, 2, 3]
+
+
+def test_terms_are_combined_with_and():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index, "python streamlit") == [1, 3]
+    assert ids(index, "streamlit news") == [3]
+    assert ids(index, "prophet news") == []
+
+
+def test_empty_query_returns_catalog_order():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index) == [1, 2, 3]
+
+
+def test_facet_filters_or_within_and_across():
+    index = search.SearchIndex(PROJECTS)
+    assert ids(index, filters={"client": ["FinTech", "Retail"]}) == [1, 2]
+    assert ids(index, filters={"client": ["FinTech", "Retail"], "stack": ["Streamlit"]}) == [1]
+
+
+def test_facet_counts_ignore_their_own_filter():
+    index = search.SearchIndex(PROJECTS)
+    hits, counts = index.search("", {"client": ["Media"]})
+    assert hits == [3]
+    # client counts ignore the client filter, so the other clients stay selectable
+    assert counts["client"] == {"FinTech": 1, "Retail": 1, "Media": 1}
+    # stack counts do apply it
+    assert counts["stack"] == {"Python": 1, "Scikit-Learn": 1, "Streamlit": 1}
+
+
+def test_facet_counts_follow_the_query():
+    index = search.SearchIndex(PROJECTS)
+    _, counts = index.search("streamlit")
+    assert counts["client"] == {"FinTech": 1, "Media": 1}
+
+
+def test_sync_adds_changes_and_removes_only_what_changed():
+    index = search.SearchIndex(PROJECTS)
+    assert index.sync(PROJECTS) == 0
+
+    edited = dict(PROJECTS[1], title="Inventory Forecasting", client="Wholesale")
+    added = {"id": 4, "title": "Churn Analysis", "stack": ["Python"], "client": "Telecom"}
+    assert index.sync([PROJECTS[0], edited, added]) == 3  # 1 changed, 1 added, 1 removed
+
+    assert ids(index, "inventory") == [2]
+    assert ids(index, "stock") == []
+    assert ids(index, "churn") == [4]
+    assert ids(index, "news") == []
+    assert "scikit-learn" not in index.postings and "stock" not in index.vocab
+    _, counts = index.search("")
+    assert counts["client"] == {"FinTech": 1, "Wholesale": 1, "Telecom": 1}
+    assert ids(index) == [1, 2, 4]
@@ -0,0 +1,43 @@
+"""Escaping and URL checks of the template layer."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import templates  # noqa: E402
+from templates import Markup, Template  # noqa: E402
+
+
+def test_fields_are_escaped_in_attributes_and_text():
+    link = Template('<a title="{title}">{title}</a>')
+    html = link.render(title='"><script>alert(1)</script>')
+    assert "<script>" not in html
+    assert 'title="&quot;&gt;&lt;script&gt;' in html
+
+
+def test_markup_is_inserted_as_is():
+    assert Template("<p>{body}</p>").render(body=Markup("<b>hi</b>")) == "<p><b>hi</b></p>"
+
+
+def test_safe_url_blocks_script_schemes():
+    for url in ("javascript:alert(1)", " JavaScript:alert(1)", "data:text/html,<b>x</b>", "vbscript:x"):
+        assert templates.safe_url(url) == "#"
+
+
+def test_safe_url_keeps_web_mail_and_relative_urls():
+    for url in ("https://github.com/x", "http://example.com", "mailto:a@b.co", "project-1.html", "#"):
+        assert templates.safe_url(url) == url
+
+
+def test_social_link_with_javascript_url_is_neutralised():
+    html = templates.socials({"GitHub": "javascript:alert(1)", "Site": 'https://x.co/"onmouseover="x'})
+    assert "javascript:" not in html
+    assert 'href="#"' in html
+    assert '"onmouseover="' not in html
+
+
+def test_full_image_keeps_inline_images_only():
+    assert 'src="data:image/png;base64,AAAA"' in templates.full_image("data:image/png;base64,AAAA")
+    assert 'src="#"' in templates.full_image("javascript:alert(1)")
+    assert 'src="app/static/assets/a.0123456789abcdef.webp"' in templates.full_image(
+        "app/static/assets/a.0123456789abcdef.webp")
@@ -0,0 +1,501 @@
+"""
+Page stylesheet, shared by Portfolio.py and the static export (export_site.py).
+"""
+
+# Flattened to prevent Markdown parsing errors
+CUSTOM_CSS = """
+/* FONTS */
+@import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;500;700&family=Inter:wght@300;400;600&family=JetBrains+Mono:wght@400;500&display=swap');
+
+/* GLOBAL VARIABLES */
+:root {
+    --bg: #0b0c10;
+    --bg-secondary: #1a1d23;
+    --card-bg: #1f2833;
+    --accent: #66fcf1;
+    --accent-secondary: #45a29e;
+    --text: #c5c6c7;
+    --text-highlight: #ffffff;
+    --text-muted: #8a8d93;
+    --success: #4ade80;
+    --warning: #fbbf24;
+    --error: #ef4444;
+}
+
+/* RESET & BASICS */
+html, body, [class*="css"] {
+    font-family: 'Inter', sans-serif;
+    color: var(--text);
+    background-color: var(--bg);
+}
+
+h1, h2, h3 {
+    font-family: 'Space Grotesk', sans-serif;
+    color: var(--text-highlight);
+    letter-spacing: -1px;
+}
+
+/* REMOVE STREAMLIT CHROME */
+#MainMenu, footer, header {visibility: hidden;}
+/* Collapse the element that only carries the stylesheet <link> */
+.stElementContainer:has(link[rel="stylesheet"]) {display: none;}
+
+/* CUSTOM SCROLLBAR */
+::-webkit-scrollbar {width: 8px;}
+::-webkit-scrollbar-track {background: var(--bg);}
+::-webkit-scrollbar-thumb {background: #45a29e; border-radius: 4px;}
+::-webkit-scrollbar-thumb:hover {background: #66fcf1;}
+
+/* MAGNETIC ELEMENTS */
+.magnetic-element {
+    transition: all 0.3s cubic-bezier(0.25, 0.46, 0.45, 0.94);
+}
+
+.magnetic-element:hover {
+    transform: scale(1.05);
+    box-shadow: 0 10px 30px rgba(102, 252, 241, 0.3);
+}
+
+/* HERO SECTION STYLING */
+.hero-container {
+    padding: 4rem 0 2rem 0;
+    animation: slideInFromBottom 1.2s cubic-bezier(0.25, 0.46, 0.45, 0.94);
+    position: relative;
+    z-index: 1;
+}
+.big-title {
+    font-size: 4.5rem;
+    font-weight: 700;
+    background: linear-gradient(135deg, #ffffff 0%, #66fcf1 50%, #45a29e 100%);
+    background-size: 200% 200%;
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    animation: gradientShift 4s ease-in-out infinite;
+    line-height: 1.1;
+    margin-bottom: 0.5rem;
+    text-shadow: 0 0 30px rgba(102, 252, 241, 0.3);
+}
+.subtitle {
+    font-size: 1.5rem;
+    color: #45a29e;
+    margin-bottom: 2rem;
+    animation: fadeInUp 1.5s ease-out 0.3s both;
+}
+
+@keyframes gradientShift {
+    0%, 100% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+}
+@keyframes slideInFromBottom {
+    from { transform: translateY(50px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+@keyframes fadeInUp {
+    from { transform: translateY(20px); opacity: 0; }
+    to { transform: translateY(0); opacity: 1; }
+}
+
+/* DYNAMIC PROFILE IMAGE */
+.profile-img-container {
+    display: flex !important;
+    justify-content: center;
+    margin-bottom: 20px;
+    visibility: visible !important;
+}
+.profile-img {
+    width: 220px;
+    height: 220px;
+    object-fit: cover;
+    border: 2px solid var(--accent);
+    box-shadow: 0 0 30px rgba(102, 252, 241, 0.3);
+    /* The "Morphing" Shape */
+    border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
+    animation: morph 8s ease-in-out infinite;
+    transition: all 0.5s ease-in-out;
+}
+.profile-img:hover {
+    transform: scale(1.05);
+    box-shadow: 0 0 50px rgba(102, 252, 241, 0.6);
+}
+
+/* MOBILE-ONLY PROFILE IMAGE (appears before name on small screens) */
+.profile-img-mobile {
+    display: none;
+}
+
+@keyframes morph {
+    0% {border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;}
+    50% {border-radius: 30% 60% 70% 40% / 50% 60% 30% 60%;}
+    100% {border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;}
+}
+
+/* ENHANCED BENTO BOX CARD DESIGN */
+div[data-testid="stVerticalBlock"] > div > div[data-testid="stVerticalBlock"] {
+    gap: 1.5rem;
+}
+
+.project-card {
+    background: rgba(31, 40, 51, 0.8) !important;
+    border: 1px solid rgba(102, 252, 241, 0.15) !important;
+    border-radius: 20px;
+    padding: 28px !important;
+    transition: all 0.5s cubic-bezier(0.25, 0.8, 0.25, 1);
+    height: 100%;
+    backdrop-filter: blur(20px);
+    position: relative;
+    overflow: hidden;
+    cursor: pointer;
+    box-shadow:
+        0 8px 32px rgba(0, 0, 0, 0.3),
+        inset 0 1px 0 rgba(255, 255, 255, 0.1);
+    display: block !important;
+    visibility: visible !important;
+    opacity: 1 !important;
+}
+
+.project-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg,
+        transparent,
+        rgba(102, 252, 241, 0.2),
+        rgba(102, 252, 241, 0.1),
+        transparent);
+    transition: left 0.8s ease;
+}
+
+.project-card::after {
+    content: '';
+    position: absolute;
+    top: -50%;
+    left: -50%;
+    width: 200%;
+    height: 200%;
+    background: radial-gradient(circle, rgba(102, 252, 241, 0.03) 0%, transparent 70%);
+    opacity: 0;
+    transition: opacity 0.5s ease;
+    pointer-events: none;
+}
+
+.project-card:hover::before {
+    left: 100%;
+    width: 200%;
+}
+
+.project-card:hover::after {
+    opacity: 1;
+}
+
+.project-card:hover {
+    transform: translateY(-12px) scale(1.03);
+    border-color: var(--accent);
+    box-shadow:
+        0 20px 40px -10px rgba(102, 252, 241, 0.4),
+        0 0 60px rgba(102, 252, 241, 0.2),
+        inset 0 1px 0 rgba(255, 255, 255, 0.2);
+}
+
+/* ENHANCED METRIC HIGHLIGHT */
+.metric-pill {
+    display: inline-block;
+    background: linear-gradient(135deg, rgba(102, 252, 241, 0.15) 0%, rgba(102, 252, 241, 0.05) 100%);
+    color: var(--accent);
+    padding: 6px 16px;
+    border-radius: 25px;
+    font-size: 0.85rem;
+    font-weight: 700;
+    margin-bottom: 12px;
+    border: 1px solid rgba(102, 252, 241, 0.3);
+    box-shadow: 0 2px 10px rgba(102, 252, 241, 0.1);
+    position: relative;
+    overflow: hidden;
+}
+
+.metric-pill::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(102, 252, 241, 0.2), transparent);
+    transition: left 0.5s ease;
+}
+
+.metric-pill:hover::before {
+    left: 100%;
+}
+
+/* TESTIMONIAL CARD */
+.testimonial-card {
+    background: rgba(31, 40, 51, 0.3);
+    border-left: 4px solid var(--accent);
+    padding: 20px;
+    border-radius: 0 12px 12px 0;
+    margin-bottom: 10px;
+}
+
+/* ENHANCED BUTTONS OVERRIDE */
+.stButton > button {
+    background: linear-gradient(135deg, rgba(102, 252, 241, 0.1) 0%, rgba(102, 252, 241, 0.05) 100%);
+    border: 1px solid var(--accent);
+    color: var(--accent);
+    border-radius: 12px;
+    font-weight: 600;
+    transition: all 0.4s cubic-bezier(0.25, 0.8, 0.25, 1);
+    width: 100%;
+    position: relative;
+    overflow: hidden;
+    backdrop-filter: blur(10px);
+}
+
+.stButton > button::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: -100%;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, transparent, rgba(102, 252, 241, 0.2), transparent);
+    transition: left 0.5s ease;
+}
+
+.stButton > button:hover::before {
+    left: 100%;
+}
+
+.stButton > button:hover {
+    background: linear-gradient(135deg, var(--accent) 0%, var(--accent-secondary) 100%);
+    color: #0b0c10;
+    box-shadow:
+        0 8px 25px rgba(102, 252, 241, 0.4),
+        0 0 40px rgba(102, 252, 241, 0.3);
+    transform: translateY(-2px);
+}
+
+/* DOWNLOAD BUTTON (Primary) */
+.stDownloadButton > button {
+    background: var(--accent);
+    color: #0b0c10;
+    border: none;
+    font-weight: 700;
+}
+.stDownloadButton > button:hover {
+    background: #45a29e;
+    box-shadow: 0 0 20px rgba(102, 252, 241, 0.7);
+}
+
+/* Static-file download links get the same look as the button */
+a.download-link {
+    display: inline-block;
+    padding: 0.4rem 0.9rem;
+    border-radius: 0.5rem;
+    background: var(--accent);
+    color: #0b0c10 !important;
+    font-weight: 700;
+    text-decoration: none;
+    transition: all 0.3s ease;
+}
+a.download-link:hover {
+    background: #45a29e;
+    box-shadow: 0 0 20px rgba(102, 252, 241, 0.7);
+}
+
+/* ADVANCED ANIMATIONS */
+@keyframes fadeIn {
+    from {opacity: 0; transform: translateY(20px);}
+    to {opacity: 1; transform: translateY(0);}
+}
+
+@keyframes slideInFromLeft {
+    from {opacity: 0; transform: translateX(-50px);}
+    to {opacity: 1; transform: translateX(0);}
+}
+
+@keyframes slideInFromRight {
+    from {opacity: 0; transform: translateX(50px);}
+    to {opacity: 1; transform: translateX(0);}
+}
+
+@keyframes scaleIn {
+    from {opacity: 0; transform: scale(0.8);}
+    to {opacity: 1; transform: scale(1);}
+}
+
+@keyframes glowPulse {
+    0%, 100% {
+        box-shadow: 0 0 20px rgba(102, 252, 241, 0.3);
+    }
+    50% {
+        box-shadow: 0 0 40px rgba(102, 252, 241, 0.6), 0 0 60px rgba(102, 252, 241, 0.4);
+    }
+}
+
+/* SKILLS PROGRESS BARS */
+.skill-bar {
+    width: 100%;
+    height: 8px;
+    background: rgba(255, 255, 255, 0.1);
+    border-radius: 4px;
+    overflow: hidden;
+    margin: 8px 0 16px 0;
+}
+.skill-fill {
+    height: 100%;
+    background: linear-gradient(90deg, var(--accent), var(--accent-secondary));
+    border-radius: 4px;
+    width: 0%;
+}
+
+/* INTERACTIVE ELEMENTS */
+.glow-button {
+    position: relative;
+    overflow: hidden;
+    transition: all 0.3s ease;
+}
+.glow-button::after {
+    content: '';
+    position: absolute;
+    top: 50%;
+    left: 50%;
+    width: 0;
+    height: 0;
+    background: radial-gradient(circle, rgba(102, 252, 241, 0.3) 0%, transparent 70%);
+    transition: width 0.6s, height 0.6s;
+    transform: translate(-50%, -50%);
+    border-radius: 50%;
+}
+.glow-button:hover::after {
+    width: 300px;
+    height: 300px;
+}
+
+/* TYPING ANIMATION */
+.typing-animation {
+    border-right: 2px solid var(--accent);
+    animation: blink 1s infinite;
+}
+@keyframes blink {
+    0%, 50% { border-color: var(--accent); }
+    51%, 100% { border-color: transparent; }
+}
+
+/* SCROLL-TRIGGERED ANIMATIONS */
+.project-card, .testimonial-card {
+    opacity: 1 !important;
+    transform: translateY(0) !important;
+    visibility: visible !important;
+    display: block !important;
+}
+
+.project-card:nth-child(odd) {
+    animation: slideInFromLeft 0.8s ease-out;
+}
+
+.project-card:nth-child(even) {
+    animation: slideInFromRight 0.8s ease-out;
+}
+
+.animate-in {
+    opacity: 1 !important;
+    transform: translateY(0) !important;
+}
+
+/* ENHANCED SKILL BARS */
+.skill-bar {
+    width: 100%;
+    height: 8px;
+    background: rgba(255, 255, 255, 0.1);
+    border-radius: 4px;
+    overflow: hidden;
+    margin: 8px 0 16px 0;
+    position: relative;
+}
+
+.skill-bar::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(90deg, rgba(102, 252, 241, 0.2) 0%, rgba(102, 252, 241, 0.1) 100%);
+    border-radius: 4px;
+}
+
+.skill-fill {
+    height: 100%;
+    background: linear-gradient(90deg, var(--accent), var(--accent-secondary));
+    border-radius: 4px;
+    width: 0%;
+    position: relative;
+    box-shadow: 0 0 10px rgba(102, 252, 241, 0.5);
+    /* Each bar sets --target inline; one keyframe serves every skill */
+    animation: progressAnimation 2s ease-in-out forwards;
+}
+
+@keyframes progressAnimation {
+    from { width: 0%; }
+    to { width: var(--target); }
+}
+
+/* MOBILE TWEAKS */
+@media (max-width: 768px) {
+    .big-title {
+        font-size: 2.5rem;
+        line-height: 1.2;
+    }
+    .subtitle { font-size: 1.2rem; }
+    .hero-container { padding: 2rem 0 1rem 0; }
+    .project-card {
+        padding: 16px;
+        margin-bottom: 16px;
+    }
+    .profile-img { width: 180px; height: 180px; }
+
+    /* On mobile show mobile image inside hero and hide desktop column image */
+    .profile-img-mobile {
+        display: block !important;
+        width: 180px;
+        height: 180px;
+        object-fit: cover;
+        border: 2px solid var(--accent);
+        box-shadow: 0 0 30px rgba(102, 252, 241, 0.3);
+        border-radius: 60% 40% 30% 70% / 60% 30% 70% 40%;
+        margin: 0 auto 14px auto;
+    }
+
+    .profile-img-container { display: none !important; }
+}
+
+@media (max-width: 480px) {
+    .big-title { font-size: 2rem; }
+    .project-card { padding: 12px; }
+    .profile-img { width: 150px; height: 150px; }
+
+    /* slightly smaller mobile-only image */
+    .profile-img-mobile {
+        width: 150px !important;
+        height: 150px !important;
+    }
+}
+
+/* TABLET OPTIMIZATIONS */
+@media (min-width: 769px) and (max-width: 1024px) {
+    .big-title { font-size: 3.5rem; }
+    .project-card { padding: 20px; }
+}
+
+/* ACCESSIBILITY */
+@media (prefers-reduced-motion: reduce) {
+    *, *::before, *::after {
+        animation-duration: 0.01ms !important;
+        animation-iteration-count: 1 !important;
+        transition-duration: 0.01ms !important;
+    }
+}
+"""